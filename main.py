@@ -1,4 +1,9 @@
+import multiprocessing
+
 from snapmerge.main_app import main
 
 if __name__ == "__main__":
+    # Word page counting and the merge conversions run in process pools;
+    # needed in the frozen build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -18,6 +18,10 @@ python -m pip install -U -r requirements.txt pyinstaller >nul
 REM --- write build info (version basado en git/CI) ---
 python src\snapmerge\app_version\write_build_info.py
 
+REM --- compile the Qt Designer form once (the app imports snap_merge_app_ui.py, never parses the .ui at runtime) ---
+pyside6-uic src\snapmerge\ui\snap_merge_app.ui -o src\snapmerge\ui\snap_merge_app_ui.py
+if errorlevel 1 echo [ERROR] pyside6-uic failed & exit /b 1
+
 REM --- clean ---
 if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
@@ -1,19 +1,23 @@
 from __future__ import annotations
+import json
+import os
+import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).parent.parent
 COMMON = ROOT / "app_version"
 BUILD_DIR = ROOT / "build"
 
+_APP_VERSION_RE = re.compile(r"""^\s*APP_VERSION\s*=\s*["']([^"']+)["']""", re.M)
+
 def read_app_version() -> str:
     text = (COMMON / "version.py").read_text(encoding="utf-8")
-    for line in text.splitlines():
-        line = line.strip()
-        if line.startswith("APP_VERSION"):
-            return line.split("=", 1)[1].strip().strip('"\'\'')
-    return "0.0.0"
+    m = _APP_VERSION_RE.search(text)
+    return m.group(1) if m else "0.0.0"
 
 def get_git_sha() -> str:
     try:
@@ -29,26 +33,121 @@ def commits_since_version_tag(app_version: str):
     except Exception:
         return None
 
+def _find_git_dir() -> Path | None:
+    for parent in (ROOT, *ROOT.resolve().parents):
+        git_dir = parent / ".git"
+        if git_dir.is_dir():
+            return git_dir
+    return None
+
+def _git_state_key(app_version: str) -> list | None:
+    """
+    Cheap fingerprint of the repo state the git queries depend on:
+    HEAD, the ref it points to, packed refs and tags (by mtime).
+    """
+    git_dir = _find_git_dir()
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    key: list = [app_version, head]
+    watched = [git_dir / "HEAD", git_dir / "packed-refs", git_dir / "refs" / "tags"]
+    if head.startswith("ref:"):
+        watched.append(git_dir / head[4:].strip())
+    for p in watched:
+        try:
+            key.append(p.stat().st_mtime_ns)
+        except OSError:
+            key.append(0)
+    return key
+
+def git_info(app_version: str) -> tuple[str, int | None]:
+    """
+    Return (short SHA, commits since the version tag).
+
+    Both git calls run concurrently. The result is cached in BUILD_DIR
+    and reused while HEAD, the checked-out ref and the tags are unchanged.
+    """
+    cache = BUILD_DIR / "git_cache.json"
+    key = _git_state_key(app_version)
+    if key is not None:
+        try:
+            cached = json.loads(cache.read_text(encoding="utf-8"))
+            if cached.get("key") == key:
+                return cached["git_sha"], cached["commits"]
+        except Exception:
+            pass
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        sha_future = pool.submit(get_git_sha)
+        commits_future = pool.submit(commits_since_version_tag, app_version)
+        git_sha, commits = sha_future.result(), commits_future.result()
+
+    if key is not None and git_sha != "nogit":
+        BUILD_DIR.mkdir(exist_ok=True)
+        cache.write_text(
+            json.dumps({"key": key, "git_sha": git_sha, "commits": commits}),
+            encoding="utf-8",
+        )
+    return git_sha, commits
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
 def next_build_number() -> int:
+    """
+    Increment BUILD_DIR/build_number.txt and return the new value.
+
+    Read and write happen on one descriptor under an exclusive lock, so
+    concurrent builds never hand out the same number.
+    """
     BUILD_DIR.mkdir(exist_ok=True)
-    f = BUILD_DIR / "build_number.txt"
-    if not f.exists():
-        f.write_text("0", encoding="utf-8")
+    fd = os.open(BUILD_DIR / "build_number.txt", os.O_RDWR | os.O_CREAT, 0o644)
     try:
-        current = int((f.read_text(encoding="utf-8") or "0").strip())
-    except Exception:
-        current = 0
-    next_n = current + 1
-    f.write_text(str(next_n), encoding="utf-8")
+        _lock(fd)
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            raw = os.read(fd, 64)
+            try:
+                current = int(raw.decode("utf-8").strip() or "0")
+            except ValueError:
+                current = 0
+            next_n = current + 1
+            data = str(next_n).encode("utf-8")
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, data)
+            os.ftruncate(fd, len(data))
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
     return next_n
 
 def write_build_info():
     app_version = read_app_version()
-    build_number = commits_since_version_tag(app_version)
+    git_sha, build_number = git_info(app_version)
     if build_number is None:
         build_number = next_build_number()
 
-    git_sha = get_git_sha()
     build_date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     full_version = f"{app_version}+{build_number}.{git_sha}"
 
@@ -14,10 +14,17 @@ ORIGINAL_FILENAME = "SnapMerge.exe"
 COPYRIGHT = "© 2025 CSOD"
 COMMENTS = "Developed by Josue Cruz"
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).parent.parent
 TEMPLATE = ROOT / "app_version" / "version_info_template.txt"
 TARGET   = ROOT / "app_version" / "version_info.txt"
 
+_BUILD_RE = re.compile(r"\d+")
+
+class _SafeMap(dict):
+    """format_map mapping that leaves unknown {FIELDS} untouched."""
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
 def _parse_to_tuple(version_str: str) -> tuple[int, int, int, int]:
     """
     Converts versions like '2.5.6+6.1126ed3' or '2.5.6' into (2,5,6,6)
@@ -31,7 +38,7 @@ def _parse_to_tuple(version_str: str) -> tuple[int, int, int, int]:
     patch = int(parts[2]) if len(parts) > 2 else 0
     # ensure BUILD_NUMBER is a string before applying regex and handle no-match
     build_str = str(BUILD_NUMBER) if BUILD_NUMBER is not None else "0"
-    m = re.search(r"\d+", build_str)
+    m = _BUILD_RE.search(build_str)
     build = int(m.group()) if m else 0
     return (major, minor, patch, build)
 
@@ -40,19 +47,20 @@ def main():
     prod_vers = file_vers
 
     txt = TEMPLATE.read_text(encoding="utf-8")
-    txt = (
-        txt.replace("{FILE_VERS}", f"{file_vers}")
-           .replace("{PROD_VERS}", f"{prod_vers}")
-           .replace("{COMPANY_NAME}", COMPANY_NAME)
-           .replace("{FILE_DESCRIPTION}", FILE_DESCRIPTION)
-           .replace("{FILE_VERSION_STR}", FULL_VERSION)
-           .replace("{INTERNAL_NAME}", INTERNAL_NAME)
-           .replace("{COPYRIGHT}", COPYRIGHT)
-           .replace("{ORIGINAL_FILENAME}", ORIGINAL_FILENAME)
-           .replace("{PRODUCT_NAME}", PRODUCT_NAME)
-           .replace("{PRODUCT_VERSION_STR}", FULL_VERSION)
-           .replace("{COMMENTS}", COMMENTS)
-    )
+    # Single pass over the template instead of one replace() per field
+    txt = txt.format_map(_SafeMap(
+        FILE_VERS=f"{file_vers}",
+        PROD_VERS=f"{prod_vers}",
+        COMPANY_NAME=COMPANY_NAME,
+        FILE_DESCRIPTION=FILE_DESCRIPTION,
+        FILE_VERSION_STR=FULL_VERSION,
+        INTERNAL_NAME=INTERNAL_NAME,
+        COPYRIGHT=COPYRIGHT,
+        ORIGINAL_FILENAME=ORIGINAL_FILENAME,
+        PRODUCT_NAME=PRODUCT_NAME,
+        PRODUCT_VERSION_STR=FULL_VERSION,
+        COMMENTS=COMMENTS,
+    ))
 
     TARGET.write_text(txt, encoding="utf-8")
     print(f"[version] wrote {TARGET} with FULL_VERSION={FULL_VERSION}")
@@ -1,7 +1,10 @@
 from __future__ import annotations
-import yaml
+import functools
+import json
+import os
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from .types_job_types import JobSettings
+from .types_job_types import ExtKind, JobSettings, SortBy
 
 
 DEFAULTS = {
@@ -19,40 +22,176 @@ DEFAULTS = {
     "word_page_count": True
     }
 
+# Settings list -> kind, in precedence order (a suffix listed twice keeps the first)
+_KIND_SETTINGS: tuple[tuple[str, ExtKind], ...] = (
+    ("allowed_pdfs", "pdf"),
+    ("allowed_images", "image"),
+    ("allowed_docs", "doc"),
+    ("allowed_emails", "eml"),
+    ("allowed_zip", "zip"),
+)
+
+# Resolved once at import; the default config.yaml lives at the repo root
+_PKG_ROOT = Path(__file__).resolve().parent
+
+# Process-wide Settings loaded from default_path(), see Settings.get_default()
+_DEFAULT_INSTANCE: Settings | None = None
+
+def _load_config(path: Path, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a config.yaml through a JSON sidecar (<name>.jsoncache).
+
+    The sidecar records the YAML's mtime and size and is reused while they
+    match, so an unchanged config costs a json.loads instead of a YAML parse.
+    """
+    sidecar = path.with_name(path.name + ".jsoncache")
+    stamp = [mtime_ns, size]
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached["source"] == stamp:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    import yaml  # deferred: only needed when a config file is parsed
+    # Prefer the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Hand the raw bytes to the parser; no intermediate str decode
+    with path.open("rb") as fh:
+        data = yaml.load(fh, Loader=loader) or {}
+
+    # Best effort: the config folder may be read-only (installed builds)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"source": stamp, "data": data}), encoding="utf-8")
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+    return data
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parsed config per (path, mtime, size); an edited file gets a new key."""
+    return _load_config(Path(path_str), mtime_ns, size)
+
+def _default_list(key: str):
+    return field(default_factory=lambda: list(DEFAULTS[key]))
+
+@dataclass(slots=True)
 class Settings:
-    def __init__(self, data: dict | None = None):
-        self._data = {**DEFAULTS, **(data or {})}
-        
-    @property
-    def allowed_exts(self):
-        """Return a unified set of all allowed file extensions."""
-        return set(
-            self._data["allowed_images"]
-            + self._data["allowed_docs"]
-            + self._data["allowed_pdfs"]
-            + self._data["allowed_emails"]
-            + self._data["allowed_zip"]
+    """Application settings (config.yaml merged over DEFAULTS).
+
+    Values are coerced to their field types once at construction, so
+    readers can use plain attribute access. Keys that are not fields
+    (e.g. ``max_docs_for_word_batch``) are kept in ``extra`` and remain
+    reachable through ``get()``.
+    """
+
+    include_subfolders: bool = DEFAULTS["include_subfolders"]
+    image_margin_pts: int = DEFAULTS["image_margin_pts"]
+    sort_by: SortBy = DEFAULTS["sort_by"]
+    sort_desc: bool = DEFAULTS["sort_desc"]
+    allowed_images: list[str] = _default_list("allowed_images")
+    allowed_docs: list[str] = _default_list("allowed_docs")
+    allowed_pdfs: list[str] = _default_list("allowed_pdfs")
+    allowed_emails: list[str] = _default_list("allowed_emails")
+    allowed_zip: list[str] = _default_list("allowed_zip")
+    max_image_dim_px: int = DEFAULTS["max_image_dim_px"]
+    workers: int = DEFAULTS["workers"]
+    word_page_count: bool = DEFAULTS["word_page_count"]
+    extra: dict = field(default_factory=dict)
+    # All allowed extensions (lowercase), computed once in __post_init__
+    allowed_exts: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Same set without the leading dot, for name.rpartition(".") lookups
+    allowed_ext_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Suffix (lowercase, with the dot) -> kind; the one map the window and
+    # the pipeline both classify files with. Treat as read-only.
+    ext_kinds: dict[str, ExtKind] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.include_subfolders = bool(self.include_subfolders)
+        self.image_margin_pts = int(self.image_margin_pts)
+        self.sort_desc = bool(self.sort_desc)
+        self.max_image_dim_px = int(self.max_image_dim_px)
+        self.workers = int(self.workers)
+        self.word_page_count = bool(self.word_page_count)
+        self.allowed_images = list(self.allowed_images or [])
+        self.allowed_docs = list(self.allowed_docs or [])
+        self.allowed_pdfs = list(self.allowed_pdfs or [])
+        self.allowed_emails = list(self.allowed_emails or [])
+        self.allowed_zip = list(self.allowed_zip or [])
+        self.allowed_exts = frozenset(
+            e.lower()
+            for e in (
+                self.allowed_images
+                + self.allowed_docs
+                + self.allowed_pdfs
+                + self.allowed_emails
+                + self.allowed_zip
+            )
         )
+        self.allowed_ext_names = frozenset(e.lstrip(".") for e in self.allowed_exts)
+        self.ext_kinds = {}
+        for key, kind in _KIND_SETTINGS:
+            for ext in getattr(self, key):
+                self.ext_kinds.setdefault(ext.lower(), kind)
+
+    @classmethod
+    def from_dict(cls, data: dict | None = None) -> "Settings":
+        """Build Settings from a config mapping, falling back to DEFAULTS."""
+        # Missing keys take the field defaults (which mirror DEFAULTS), so
+        # only the given mapping is walked; no merged copy is built.
+        data = data or {}
+        known = {k: v for k, v in data.items() if k in _FIELD_NAMES}
+        extra = {k: v for k, v in data.items() if k not in _FIELD_NAMES}
+        return cls(**known, extra=extra)
+
+    @classmethod
+    def default_path(cls) -> Path:
+        """Location of the bundled config.yaml."""
+        return _PKG_ROOT.parent.parent / "config.yaml"
 
     @classmethod
     def from_file(cls, path: Path) -> "Settings":
         if not path.exists():
             return cls()
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        return cls(data)
+        st = path.stat()
+        return cls.from_dict(_load_cached(str(path), st.st_mtime_ns, st.st_size))
+
+    @classmethod
+    def get_default(cls) -> "Settings":
+        """Return the shared Settings loaded from config.yaml (parsed once per process).
+
+        Treat the result as read-only; use ``overlay()`` for per-run changes.
+        """
+        global _DEFAULT_INSTANCE
+        if _DEFAULT_INSTANCE is None:
+            _DEFAULT_INSTANCE = cls.from_file(cls.default_path())
+        return _DEFAULT_INSTANCE
+
+    def overlay(self, **changes) -> "Settings":
+        """Return a copy with the given fields replaced, leaving self untouched."""
+        return replace(self, **changes)
 
     def as_job(self, input_dir: Path, output_pdf: Path) -> JobSettings:
         return JobSettings(
         input_dir=input_dir,
         output_pdf=output_pdf,
-        include_subfolders=bool(self._data["include_subfolders"]),
-        sort_by=self._data["sort_by"],
-        sort_desc=bool(self._data["sort_desc"]),
-        image_margin_pts=int(self._data["image_margin_pts"]),
-        max_image_dim_px=int(self._data["max_image_dim_px"]),
-        workers=int(self._data["workers"]),
-        word_page_count=bool(self._data["word_page_count"]),
+        include_subfolders=self.include_subfolders,
+        sort_by=self.sort_by,
+        sort_desc=self.sort_desc,
+        image_margin_pts=self.image_margin_pts,
+        max_image_dim_px=self.max_image_dim_px,
+        workers=self.workers,
+        word_page_count=self.word_page_count,
         )
 
     def get(self, key: str, default=None):
-        return self._data.get(key, default)
\ No newline at end of file
+        if key in _FIELD_NAMES:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Settings) if f.init and f.name != "extra")
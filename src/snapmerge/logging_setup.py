@@ -1,26 +1,98 @@
+import atexit
+import io
 import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
 _def_logger = None
+_init_lock = threading.Lock()
+
+class _FastFormatter(logging.Formatter):
+    """Formatter that strftime()s each second once and reuses it for every record in it."""
+
+    _cached_sec = -1
+    _cached_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._cached_sec = sec
+        return self.default_msec_format % (self._cached_str, record.msecs)
+
+# One formatter shared by the console and file handlers
+_FORMATTER = _FastFormatter(LOG_FORMAT)
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes encoded records into a 64 KiB binary buffer.
+
+    Records reach the disk when the buffer fills or on flush()/close();
+    logging.shutdown() at exit flushes and closes it like any handler.
+    """
+
+    def _open(self):
+        return io.BufferedWriter(
+            io.FileIO(self.baseFilename, "a"), buffer_size=LOG_FILE_BUFFER_SIZE
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            data = (self.format(record) + self.terminator).encode(self.encoding or "utf-8")
+            self.stream.write(data)
+        except Exception:
+            self.handleError(record)
 
 def get_logger(name: str = "snapmerge", logfile: Path | None = None) -> logging.Logger:
+    """
+    Return the shared logger.
+
+    The logger only carries a QueueHandler, so callers (e.g. the merge
+    thread) just enqueue records; a QueueListener thread does the actual
+    console/file writes and is stopped (drained) at interpreter exit.
+    """
     global _def_logger
     if _def_logger:
         return _def_logger
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    # Worker threads may ask for the logger at the same time; only one of
+    # them may wire the handlers.
+    with _init_lock:
+        if _def_logger:
+            return _def_logger
+
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+
+        # logging.getLogger() caches by name: don't stack a second set of
+        # handlers on a logger that is already configured.
+        if not logger.handlers:
+            ch = logging.StreamHandler()
+            ch.setFormatter(_FORMATTER)
+            handlers: list[logging.Handler] = [ch]
+
+            if logfile:
+                fh = BufferedFileHandler(logfile, encoding="utf-8")
+                fh.setFormatter(_FORMATTER)
+                handlers.append(fh)
 
-    ch = logging.StreamHandler()
-    ch.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(ch)
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(q))
 
-    if logfile:
-        fh = logging.FileHandler(logfile, encoding="utf-8")
-        fh.setFormatter(logging.Formatter(LOG_FORMAT))
-        logger.addHandler(fh)
+            listener = QueueListener(q, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
 
-    _def_logger = logger
-    return logger
\ No newline at end of file
+        _def_logger = logger
+    return logger
@@ -1,29 +1,48 @@
 from __future__ import annotations
 import html
+import os
 import shutil
 import sys
 import tempfile
+import time
 import zipfile
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Mapping
 
-from PySide6.QtCore import Qt, QThread
-from PySide6.QtGui import QIcon, QCloseEvent
-from PySide6.QtUiTools import loadUiType
+from PySide6.QtCore import QStandardPaths, QThread, QThreadPool, QTimer
+from PySide6.QtGui import QIcon, QCloseEvent, QTextCursor
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
     QMainWindow,
     QMessageBox,
-    QTableWidgetItem,
     QAbstractItemView,
     QHeaderView
 )
 
 from snapmerge.config import Settings
-from snapmerge.services.eml_to_pdf import estimate_eml_pages
+from snapmerge.services.file_discovery import scan_folder
+from snapmerge.services.page_count_cache import PageCountCache
+from snapmerge.services.temp_utils import TempDir
 from snapmerge.thread_worker.doc_pages_worker import DocPagesWorker
+from snapmerge.thread_worker.file_probe_worker import (
+    PROBE_CHUNK_SIZE,
+    FileProbe,
+    FileProbeSignals,
+    FileProbeTask,
+)
+from snapmerge.thread_worker.folder_scan_worker import FolderScanWorker
 from snapmerge.thread_worker.merge_worker import MergeWorker, MergeJob
+from snapmerge.types_job_types import ExtKind
+from snapmerge.ui.file_table_model import (
+    COL_NAME,
+    COL_TYPE,
+    FileRow,
+    FileTableModel,
+    format_size,
+)
 from snapmerge.ui.snap_merge_app_ui import Ui_SnapMergeWindow
 
 # ---------------------------------------------------------------------------
@@ -57,6 +76,40 @@ HERE = Path(__file__).resolve().parent
 # else:
 #     Ui_SnapMergeWindow = _ui_result
 QtBaseClass = QMainWindow
+
+# Buffered log lines are flushed to the log widget at most this often
+LOG_FLUSH_INTERVAL_MS = 200
+# Oldest log blocks are dropped past this count to bound memory/append cost
+LOG_MAX_BLOCKS = 1000
+# (name lowercase, ext, size in bytes, pages; -1 for docs) used to spot duplicates
+Signature = tuple[str, str, int, int | None]
+
+# Progress slots repaint the bar at most this often (~30 Hz), except the last step
+PROGRESS_BAR_MIN_INTERVAL_MS = 33
+# Probed rows are inserted into the table at most this often
+PROBE_FLUSH_INTERVAL_MS = 50
+
+# Per-file "Skipped ..." lines logged per reason and batch before only the
+# end-of-batch count is shown (all of them with the "verbose" setting)
+SKIP_LOG_DETAIL_LIMIT = 5
+
+# Skip reason -> (end-of-batch summary text, log style)
+_SKIP_SUMMARY = {
+    "unreadable": ("unreadable file(s)", "error"),
+    "encrypted": ("password-protected PDF(s)", "error"),
+    "same_path": ("file(s) already in the list", "warning"),
+    "same_signature": ("duplicate file(s) (same Name/Type/Size/Pages)", "warning"),
+}
+
+@dataclass
+class _AppendJob:
+    """Bookkeeping for one _append_files call while its chunks are probed."""
+
+    skip_signature_check: bool
+    last_seq: int = -1
+    added: int = 0
+    skipped: Counter[str] = field(default_factory=Counter)  # reason -> count
+    doc_candidates: list[Path] = field(default_factory=list)
     
 # ---------------------------------------------------------------------------
 # Main window
@@ -78,6 +131,7 @@ class SnapMergeApp(QtBaseClass):
         self.ui.setupUi(self)
         
         # Progress bar initial state
+        self._last_bar_tick = 0  # monotonic ms of the last throttled update
         self.ui.merge_progress_bar.setValue(0)
         self.ui.merge_progress_bar.setVisible(False)
         self.ui.merge_progress_bar.setRange(0, 100)
@@ -91,8 +145,18 @@ class SnapMergeApp(QtBaseClass):
         if icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
 
-        # Convenience alias
+        # Convenience alias; the rows live in a FileTableModel (list of FileRow)
         self.table = self.ui.files_table
+        self.files_model = FileTableModel(self)
+        self.table.setModel(self.files_model)
+        # Duplicate-detection state, kept in step with the rows so
+        # _append_files never rescans the table:
+        # resolved path -> its signature, and how many rows share a signature
+        # (several can, when "Allow Duplicate Files" was checked).
+        self._row_signatures: dict[Path, Signature] = {}
+        self._signature_counts: Counter[Signature] = Counter()
+        # Sum of the Pages column, adjusted on every add/remove/page update
+        self._total_pages = 0
 
         # Configure table
         header = self.table.horizontalHeader()
@@ -127,11 +191,6 @@ class SnapMergeApp(QtBaseClass):
         self.table.setDropIndicatorShown(True)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
-        
-        # Columns: #, Name, Type, Size, Pages, Path
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["#", "Name", "Type", "Size", "Pages", "Path"])
-        self.table.horizontalHeader().setStretchLastSection(True)
 
         # Wire toolbar buttons
         self.ui.add_files_btn.clicked.connect(self.on_add_files)
@@ -150,34 +209,74 @@ class SnapMergeApp(QtBaseClass):
 
         # Log widget
         self.ui.log_text.setReadOnly(True)
+        self.ui.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        # Read-only log: don't keep an undo record of every append
+        self.ui.log_text.setUndoRedoEnabled(False)
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self.log("Ready to merge files.")
 
         # Load settings from YAML (or defaults if file is missing)
-        config_path = HERE.parent.parent / "config.yaml"
-        self.settings = Settings.from_file(config_path)
+        self.settings = Settings.get_default()
         
-        # Cache extension groups from settings (all lowercase)
-        self.image_exts = {ext.lower() for ext in self.settings.get("allowed_images", [])}
-        self.pdf_exts = {ext.lower() for ext in self.settings.get("allowed_pdfs", [])}
-        self.doc_exts = {ext.lower() for ext in self.settings.get("allowed_docs", [])}
-        self.zip_exts = {ext.lower() for ext in self.settings.get("allowed_zip", [])}
+        # Suffix (with the dot, like Path.suffix) -> kind: one dict lookup both
+        # checks and classifies a file, the same way the pipeline does.
+        self._ext_kind: Mapping[str, ExtKind] = self.settings.ext_kinds
         
         self.word_page_count_enabled = bool(self.settings.get("word_page_count", True))
         self.max_docs_for_word_batch = int(self.settings.get("max_docs_for_word_batch", 30))
+        # Log every skipped file by name, not just the first SKIP_LOG_DETAIL_LIMIT
+        self.log_each_skipped_file = bool(self.settings.get("verbose", False))
         
         # Cache for Word page counts to avoid reopening the same file
         self._doc_pages_cache: dict[Path, int] = {}
+        # Word counts also survive restarts, keyed on (path, mtime_ns, size);
+        # _doc_stamps remembers the stamp each doc row was probed with.
+        self._doc_pages_store = PageCountCache(self._app_data_dir() / "doc_pages.json")
+        self._doc_stamps: dict[Path, tuple[int, int]] = {}
+        # PDF (is_encrypted, pages) per resolved path, with the (mtime_ns, size)
+        # it was read at; filled from the probe results (see _accept_probe)
+        self._pdf_meta_cache: dict[Path, tuple[tuple[int, int], tuple[bool, int | None]]] = {}
         
         self._merge_thread: QThread | None = None
         self._merge_worker: MergeWorker | None = None
-        self._current_staging_dir: Path | None = None
         self._last_output_pdf: Path | None = None
         self._doc_thread: QThread | None = None
         self._doc_worker: DocPagesWorker | None = None
+        self._scan_thread: QThread | None = None
+        self._scan_worker: FolderScanWorker | None = None
+        self._scan_root: Path | None = None
+        self._scan_recursive = False
+        self._scan_results: list[Path] = []
         
+        # Scratch folder for the whole session (removed in closeEvent); the
+        # .zip extraction folders live under it. Archives can be large and
+        # stay extracted all session, so this one is never RAM-backed.
+        self._session_tmp = TempDir(prefix="snapmerge_session_", prefer_ram=False)
+
         # Temporary folders used to extract content from .zip files
         self._zip_temp_dirs: list[Path] = []
 
+        # Background probing of added files (stat, PDF open, page count), see
+        # _append_files. Chunks are numbered and applied strictly in order.
+        self._probe_pool = QThreadPool.globalInstance()
+        self._probe_signals = FileProbeSignals()
+        self._probe_signals.probed.connect(self._on_files_probed)
+        self._probe_epoch = 0       # bumped by Clear so late results are dropped
+        self._probe_next_seq = 0    # sequence number of the next chunk queued
+        self._probe_done_seq = 0    # sequence number of the next chunk to apply
+        self._probe_results: dict[int, list[FileProbe]] = {}
+        self._probe_tasks: dict[int, FileProbeTask] = {}  # queued/running, by seq
+        self._probe_jobs: deque[_AppendJob] = deque()
+        self._probe_rows: list[FileRow] = []  # accepted, not yet inserted
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setSingleShot(True)
+        self._probe_timer.setInterval(PROBE_FLUSH_INTERVAL_MS)
+        self._probe_timer.timeout.connect(self._flush_probed_rows)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------    
@@ -194,9 +293,35 @@ class SnapMergeApp(QtBaseClass):
         else:
             html_msg = f'<span style="color:{color};">{safe}</span>'
 
-        self.ui.log_text.append(html_msg)
+        # Appending to the QTextEdit per message is expensive on large jobs;
+        # buffer and flush them together when the timer fires.
+        self._log_buffer.append(html_msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        """
+        Write all buffered log lines to the log widget in one edit block.
+        Each line gets its own block so setMaximumBlockCount trims by line.
+        """
+        if not self._log_buffer:
+            return
+        bar = self.ui.log_text.verticalScrollBar()
+        # Follow new lines only if the user hasn't scrolled up to read
+        at_bottom = bar.value() == bar.maximum()
+        doc = self.ui.log_text.document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.End)
+        for html_msg in self._log_buffer:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(html_msg)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
-        
     def _set_ui_enabled(self, enabled: bool) -> None:
         """
         Enable or disable all main controls while a long task is running.
@@ -229,15 +354,7 @@ class SnapMergeApp(QtBaseClass):
     # -------------------- File list handling -------------------------
     def _collect_files_from_folder(self, folder: Path, recursive: bool) -> List[Path]:
         """Return the list of supported files in the folder (and subfolders if recursive=True)."""
-        if recursive:
-            candidates = folder.rglob("*")
-        else:
-            candidates = folder.iterdir()
-
-        paths: List[Path] = [
-            p for p in candidates if p.is_file() and p.suffix.lower() in self.settings.allowed_exts
-        ]
-        return paths
+        return list(scan_folder(folder, self.settings.allowed_exts, recursive))
     
     def _collect_files_from_zip(self, zip_path: Path) -> List[Path]:
         """
@@ -260,7 +377,7 @@ class SnapMergeApp(QtBaseClass):
 
         # Create a dedicated tempdir for this zip
         extract_root = Path(
-            tempfile.mkdtemp(prefix=f"snapmerge_zip_{zip_path.stem}_")
+            tempfile.mkdtemp(prefix=f"snapmerge_zip_{zip_path.stem}_", dir=self._session_tmp.path)
         )
         self._zip_temp_dirs.append(extract_root)
 
@@ -342,7 +459,7 @@ class SnapMergeApp(QtBaseClass):
         # ------------------------------------------------------------------
         expanded_paths: List[Path] = []
         for p in paths:
-            if p.is_file() and p.suffix.lower() == ".zip":
+            if self._ext_kind.get(p.suffix.lower()) == "zip" and p.is_file():
                 # Treat .zip as a "virtual folder"
                 inner_files = self._collect_files_from_zip(p)
                 expanded_paths.extend(inner_files)
@@ -357,220 +474,192 @@ class SnapMergeApp(QtBaseClass):
         # If the user checked "Overwrite if exists", we allow duplicates
         # by signature (Name/Type/Size/Pages). We only continue to block exact duplicates
         # by Path.
-        skip_signature_check = self.ui.allow_duplicate_files_chk.isChecked()
-
-        # ------------------------------------------------------------------
-        # 1) Build sets from what already exists in the table
-        # ------------------------------------------------------------------
-        existing_paths: set[Path] = set()
-        existing_signatures: set[tuple[str, str, str, str]] = set()
-        doc_candidates: list[Path] = []  # for doc page count update later
-
-        for row in range(self.table.rowCount()):
-            # actual Path actual
-            path_item = self.table.item(row, 5)  # Path column
-            if path_item is not None:
-                try:
-                    rp = Path(path_item.text()).resolve()
-                    existing_paths.add(rp)
-                except Exception:
-                    pass
-
-            # actual signature (Name, Type, Size, Pages)
-            name_item = self.table.item(row, 1)
-            type_item = self.table.item(row, 2)
-            size_item = self.table.item(row, 3)
-            pages_item = self.table.item(row, 4)
-           
-            name_text = (name_item.text() if name_item else "").lower()
-            ext_text = (type_item.text() if type_item else "").lower()
-            size_text = size_item.text() if size_item else ""
-            pages_text = pages_item.text() if pages_item else ""
-            
-            if ext_text in ("doc", "docx"):
-                signature = (name_text, ext_text, size_text) # Create special signature for doc/docx (ignore pages)
-            else:
-                signature = (name_text, ext_text, size_text, pages_text) # Full signature for others
-                
-            existing_signatures.add(signature)
-
-        # ------------------------------------------------------------------
-        # 2) Process new paths
-        # ------------------------------------------------------------------
-        added_count = 0
-        skipped_count = 0
-
-        for path in paths:
-            if not path.is_file():
-                continue
-
-            rp = path.resolve()
-
-            # File data that we will use both for signing and for displaying
-            ext = path.suffix.lower().lstrip(".")
-            
-            if "." + ext in self.pdf_exts:
-                try:
-                    from PyPDF2 import PdfReader
-                    reader = PdfReader(str(rp))
-
-                    # Some versions use .is_encrypted, others .encrypted
-                    if getattr(reader, "is_encrypted", False):
-                        skipped_count += 1
-                        self.log(
-                            f"Skipped password-protected PDF (cannot be merged): {rp}",
-                            "error"
-                        )
-                        continue
-                except Exception as exc:
-                    # A PDF that can't even be opened; it's best not to accept it.
-                    skipped_count += 1
-                    self.log(
-                        f"Skipped unreadable PDF (cannot be merged): {rp} ({exc})",
-                        "error"
-                    )
-                    continue
-
-            try:
-                size_bytes = path.stat().st_size
-            except OSError:
-                size_bytes = 0
-            size_str = self._format_size(size_bytes)
-
-            pages = self._guess_pages(path)
-            pages_text = "" if pages is None else str(pages)
-
-            if "." + ext in self.doc_exts:
-                signature = (path.name.lower(), ext.lower(), size_str)
-            else:
-                # signature (Name, Type, Size, Pages)
-                signature = (path.name.lower(), ext.lower(), size_str, pages_text)
-
-            # 2.1 Duplicated by PATH
-            if rp in existing_paths:
-                skipped_count += 1
-                self.log(
-                    f"Skipped duplicate file (same path already in the list): {rp}",
-                    "warning")
-                continue
+        job = _AppendJob(skip_signature_check=self.ui.allow_duplicate_files_chk.isChecked())
+
+        # stat, PDF open and page counting run on the thread pool in chunks;
+        # _on_files_probed applies the results in the original order.
+        for start in range(0, len(paths), PROBE_CHUNK_SIZE):
+            task = FileProbeTask(
+                self._probe_signals,
+                self._probe_epoch,
+                self._probe_next_seq,
+                paths[start:start + PROBE_CHUNK_SIZE],
+                self._ext_kind,
+                self._pdf_meta_cache,
+            )
+            self._probe_tasks[self._probe_next_seq] = task
+            job.last_seq = self._probe_next_seq
+            self._probe_next_seq += 1
+            self._probe_pool.start(task)
+
+        self._probe_jobs.append(job)
+        self._show_probe_busy()
+
+    def _on_files_probed(self, epoch: int, seq: int, probes: list) -> None:
+        """Apply probed chunks in sequence order as they become available."""
+        self._probe_tasks.pop(seq, None)
+        if epoch != self._probe_epoch:
+            return  # the list was cleared meanwhile
+        self._probe_results[seq] = probes
+
+        while self._probe_done_seq in self._probe_results:
+            done_seq = self._probe_done_seq
+            job = self._probe_jobs[0]
+            for probe in self._probe_results.pop(done_seq):
+                self._accept_probe(job, probe)
+            self._probe_done_seq += 1
+
+            if done_seq == job.last_seq:
+                self._probe_jobs.popleft()
+                self._finish_append_job(job)
+
+        if self._probe_rows and not self._probe_timer.isActive():
+            self._probe_timer.start()
+
+    def _accept_probe(self, job: _AppendJob, probe: FileProbe) -> None:
+        """
+        Apply the duplicate rules to one probed file and queue its row.
 
-            # 2.2 Duplicate by Name/Type/Size/Pages (even though the path is different)
-            # We only apply this validation if *Overwrite* is not checked.
-            if (not skip_signature_check) and (signature in existing_signatures):
-                skipped_count += 1
-                self.log(
-                    "Skipped duplicate file "
-                    "(same Name/Type/Size/Pages as another entry): "
-                    f"{path.name} [{ext}, {size_str}, pages={pages_text or '0'}]",
-                    "warning"
+        Duplicates considered:
+        - Same Path
+        - Same signature (Name, Type, Size, Pages) even if the Path is different.
+        - Same signature (Name, Type, Size) only for .doc/.docx (ignoring Pages).
+        """
+        rp = probe.resolved
+        if rp is None:
+            if probe.error is not None:
+                self._skip(
+                    job, "unreadable",
+                    f"Skipped unreadable file: {probe.path} ({probe.error})",
                 )
-                continue
+            return  # missing or not a regular file
+
+        path = probe.path
+        ext = probe.ext
+        kind = probe.kind
+        if kind == "pdf":
+            if probe.error is not None:
+                # A PDF that can't even be opened; it's best not to accept it.
+                self._skip(
+                    job, "unreadable",
+                    f"Skipped unreadable PDF (cannot be merged): {rp} ({probe.error})",
+                )
+                return
 
-            # If we get here, it's a new file → we add it
-            existing_paths.add(rp)
-            existing_signatures.add(signature)
-            added_count += 1
+            self._pdf_meta_cache[rp] = (probe.stamp, (probe.encrypted, probe.pages))
+            if probe.encrypted:
+                self._skip(
+                    job, "encrypted",
+                    f"Skipped password-protected PDF (cannot be merged): {rp}",
+                )
+                return
 
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        size_str = format_size(probe.size_bytes)
 
-            # Column 0: index (#)
-            idx_item = QTableWidgetItem(str(row + 1))
-            idx_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, idx_item)
+        # Docs: we never call word counter here, only the cache
+        is_doc = kind == "doc"
+        if is_doc:
+            pages = self._doc_pages_cache.get(rp)
+            if pages is None:
+                pages = self._doc_pages_store.get(rp, probe.stamp)
+                if pages is not None:
+                    self._doc_pages_cache[rp] = pages
+        else:
+            pages = probe.pages
+        pages_text = "" if pages is None else str(pages)
+
+        # signature (Name, Type, Size, Pages) on the exact byte size, so two
+        # files that only round to the same "12 KB" are not duplicates.
+        # Docs ignore Pages (-1): Word may not have counted them yet.
+        signature = (path.name.lower(), ext, probe.size_bytes, -1 if is_doc else pages)
+
+        # Duplicated by PATH
+        if rp in self._row_signatures:
+            self._skip(
+                job, "same_path",
+                f"Skipped duplicate file (same path already in the list): {rp}",
+            )
+            return
 
-            # Column 1: Name
-            name_item = QTableWidgetItem(path.name)
-            self.table.setItem(row, 1, name_item)
+        # Duplicate by Name/Type/Size/Pages (even though the path is different)
+        # We only apply this validation if *Overwrite* is not checked.
+        if (not job.skip_signature_check) and (signature in self._signature_counts):
+            self._skip(
+                job, "same_signature",
+                "Skipped duplicate file "
+                "(same Name/Type/Size/Pages as another entry): "
+                f"{path.name} [{ext}, {size_str}, pages={pages_text or '0'}]",
+            )
+            return
 
-            # Column 2: Type (extension)
-            type_item = QTableWidgetItem(ext)
-            self.table.setItem(row, 2, type_item)
+        # If we get here, it's a new file → we add it
+        self._row_signatures[rp] = signature
+        self._signature_counts[signature] += 1
+        self._total_pages += pages or 0
+        job.added += 1
 
-            # Column 3: Size
-            size_item = QTableWidgetItem(size_str)
-            size_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 3, size_item)
+        # Collect doc/docx candidates for later page count update
+        if is_doc:
+            self._doc_stamps[rp] = probe.stamp
+            job.doc_candidates.append(rp)
 
-            # Column 4: Pages
-            pages_item = QTableWidgetItem(pages_text)
-            pages_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 4, pages_item)
+        self._probe_rows.append(FileRow(rp, path.name, ext, probe.size_bytes, pages))
 
-            # Collect doc/docx candidates for later page count update
-            if "." + ext in self.doc_exts:
-                doc_candidates.append(rp)
+    def _skip(self, job: _AppendJob, reason: str, message: str) -> None:
+        """Count a skipped file; only the first few per reason are logged by name."""
+        job.skipped[reason] += 1
+        if self.log_each_skipped_file or job.skipped[reason] <= SKIP_LOG_DETAIL_LIMIT:
+            self.log(message, _SKIP_SUMMARY[reason][1])
 
-            # Column 5: Full path
-            path_item = QTableWidgetItem(str(rp))
-            self.table.setItem(row, 5, path_item)
+    def _flush_probed_rows(self) -> None:
+        """Insert the accepted rows with one rowsInserted and refresh the total."""
+        if self._probe_rows:
+            # # and display text come from the model; nothing to fill in
+            self.files_model.append_rows(self._probe_rows)
+            self._probe_rows = []
+        self._show_total_pages()
 
-        # ------------------------------------------------------------------
-        # 3) Post-processing: renumber, recalculate pages, doc pages
-        # ------------------------------------------------------------------
-        self._renumber_rows()
-        self._recalculate_total_pages()
+    def _finish_append_job(self, job: _AppendJob) -> None:
+        self._flush_probed_rows()
 
         # Resolve doc/docx pages in batch
-        if doc_candidates:
-            self._update_doc_pages_batch(doc_candidates)
-
-        if added_count:
-            self.log(f"Added {added_count} file(s).")
-        if skipped_count:
-            self.log(f"Skipped {skipped_count} duplicate file(s).", "warning")
-
-    @staticmethod
-    def _format_size(num_bytes: int) -> str:
-        
-        for unit in ["B", "KB", "MB", "GB"]:
-            if num_bytes < 1024.0:
-                return f"{num_bytes:.0f} {unit}"
-            num_bytes /= 1024.0
-        return f"{num_bytes:.0f} TB"
-    
-    def _guess_pages(self, path: Path) -> int | None:
-        """
-        Try to estimate page count for a file.
+        if job.doc_candidates:
+            self._update_doc_pages_batch(job.doc_candidates)
 
-        - Images: always 1 page
-        - PDFs: real page count using PyPDF2
-        - Docs: left as None for now (phase 2, if we hook into Word/COM)
-        """
-        ext = path.suffix.lower()
+        if job.added:
+            self.log(f"Added {job.added} file(s).")
+        for reason, count in job.skipped.items():
+            text, style = _SKIP_SUMMARY[reason]
+            self.log(f"Skipped {count} {text}.", style)
 
-        # Images: 1 page
-        if ext in self.image_exts:
-            return 1
+        self._show_probe_busy()
 
-        # PDFs: use PyPDF2 to get page count
-        if ext in self.pdf_exts:
-            try:
-                from PyPDF2 import PdfReader
-                reader = PdfReader(str(path))
-                return len(reader.pages)
-            except Exception:
-                # If anything goes wrong, we just don't show pages
-                return None
-            
-        if ext == ".eml":
-            try:
-                return estimate_eml_pages(path)
-            except Exception:
-                return None
+    def _show_probe_busy(self) -> None:
+        """Show the progress bar as a busy indicator while files are probed."""
+        # The bar is shared with the merge and Word workers; leave it to them
+        if self._merge_thread is not None or self._doc_thread is not None:
+            return
+        bar = self.ui.merge_progress_bar
+        if self._probe_jobs:
+            bar.setRange(0, 0)
+            bar.setVisible(True)
+        else:
+            bar.setRange(0, 100)
+            bar.setValue(0)
+            bar.setVisible(False)
 
-        # Docs: we never call word counter here
-        if ext in self.doc_exts:
-            cached = self._doc_pages_cache.get(path.resolve())
-            return cached if cached is not None else None
+    @staticmethod
+    def _app_data_dir() -> Path:
+        """Per-user folder for SnapMerge's persistent caches."""
+        location = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+        return Path(location) if location else Path.home() / ".snapmerge"
 
-        # Others: unknown
-        return None
-    
     def _update_doc_pages_batch(self, paths: list[Path]) -> None:
         """
         Launch a background worker to count doc/docx pages.
         The UI doesn't freeze; the counts are populated when the worker finishes.
+
+        ``paths`` are expected to be resolved already (as _append_files does).
         """
         if not self.word_page_count_enabled:
             return
@@ -578,12 +667,11 @@ class SnapMergeApp(QtBaseClass):
         if sys.platform != "win32":
             return
 
-        # Normalize and filter only documents that are NOT cached yet
-        to_process: list[Path] = []
-        for p in paths:
-            p_res = p.resolve()
-            if p_res.suffix.lower() in self.doc_exts and p_res not in self._doc_pages_cache:
-                to_process.append(p_res)
+        # Filter only documents that are NOT cached yet
+        to_process: list[Path] = [
+            p for p in paths
+            if self._ext_kind.get(p.suffix.lower()) == "doc" and p not in self._doc_pages_cache
+        ]
 
         if not to_process:
             return
@@ -629,6 +717,7 @@ class SnapMergeApp(QtBaseClass):
 
         # Show bar down by reusing the same
         self.ui.merge_progress_bar.setVisible(True)
+        self.ui.merge_progress_bar.setRange(0, len(paths))
         self.ui.merge_progress_bar.setValue(0)
 
         self._doc_thread.start()
@@ -642,34 +731,72 @@ class SnapMergeApp(QtBaseClass):
         self.ui.merge_progress_bar.setValue(0)
         self.ui.merge_progress_bar.setVisible(False)
     
-    def _recalculate_total_pages(self) -> None:
-        """Recalculate and display the total number of pages from the table."""
-        total = 0
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 4)  # Pages column
-            if item is None:
-                continue
-            text = (item.text() or "").strip()
-            if not text:
-                continue
-            try:
-                total += int(text)
-            except ValueError:
-                # If it's something like "?" or non-numeric, skip it
-                continue
+    def _start_folder_scan(self, folder: Path, recursive: bool) -> None:
+        """Scan the folder in a background thread; rows are added when it ends."""
+        if self._scan_thread is not None and self._scan_thread.isRunning():
+            self.log("A folder scan is already running.", "info")
+            return
+
+        self._scan_root = folder
+        self._scan_recursive = recursive
+        self._scan_results = []
 
-        # Update label in the UI
-        self.ui.total_pages_label.setText(f"Total pages: {total}")
+        self._scan_thread = QThread(self)
+        self._scan_worker = FolderScanWorker(folder, self.settings.allowed_exts, recursive)
+        self._scan_worker.moveToThread(self._scan_thread)
 
-    def _renumber_rows(self) -> None:
-        """Refresh the index (#) column after any structural change."""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item is None:
-                item = QTableWidgetItem()
-                self.table.setItem(row, 0, item)
-            item.setText(str(row + 1))
+        # Connections
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.batch.connect(self._on_folder_scan_batch)
+        self._scan_worker.finished.connect(self._on_folder_scan_finished)
+        self._scan_worker.error.connect(self._on_folder_scan_error)
+        self._scan_worker.error.connect(self._scan_thread.quit)
+        self._scan_worker.error.connect(self._scan_worker.deleteLater)
+
+        # Cleaning
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_worker.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.finished.connect(self._on_scan_thread_finished)
+        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+
+        self._set_ui_enabled(False)
+        self._scan_thread.start()
+
+    def _on_scan_thread_finished(self) -> None:
+        self._scan_thread = None
+        self._scan_worker = None
+        self._set_ui_enabled(True)
+
+    def _on_folder_scan_batch(self, paths: list) -> None:
+        self._scan_results.extend(paths)
+
+    def _on_folder_scan_finished(self, total: int) -> None:
+        paths = self._scan_results
+        self._scan_results = []
+
+        if not paths:
+            self.log("No supported files found in this folder (or subfolders).", "warning")
+            QMessageBox.information(
+                self,
+                "SnapMerge",
+                "No supported files were found in the selected folder.",
+            )
+            return
+
+        self._append_files(sorted(paths))
+        scope = " and subfolders" if self._scan_recursive else ""
+        folder_name = self._scan_root.name if self._scan_root else ""
+        self.log(f"Added {total} file(s) from folder{scope}: {folder_name}")
+
+    def _on_folder_scan_error(self, message: str, tb: str) -> None:
+        self._scan_results = []
+        self.log(f"Error scanning folder: {message}", "error")
+        if tb:
+            self.log(tb, "error")
 
+    def _show_total_pages(self) -> None:
+        """Display the running total of pages (self._total_pages)."""
+        self.ui.total_pages_label.setText(f"Total pages: {self._total_pages}")
 
     # -------------------- Background merge via QThread -----------------
     def _start_merge_job(self, job: MergeJob) -> None:
@@ -709,19 +836,8 @@ class SnapMergeApp(QtBaseClass):
 
         self._merge_thread.start()
             
-    def _cleanup_staging_dir(self) -> None:
-        """Delete internal staging dir and, optionally, temp work."""
-        # 1) Pipeline staging is ALWAYS removed
-        if self._current_staging_dir is not None:
-            try:
-                shutil.rmtree(self._current_staging_dir, ignore_errors=True)
-            except Exception:
-                # Best-effort clean-up; don't crash the app on failure
-                pass
-            finally:
-                self._current_staging_dir = None
-
-        # 2) If the user wants "Clean Work", we clean EVERYTHING
+    def _cleanup_work_dirs(self) -> None:
+        """Delete temp work (extracted .zip folders) if "Clean Work" is checked."""
         if self.ui.clean_work_chk.isChecked():
             # Delete the tempdirs from the .zip file (if any)
             if getattr(self, "_zip_temp_dirs", None):
@@ -746,8 +862,16 @@ class SnapMergeApp(QtBaseClass):
     def _on_worker_status(self, message: str) -> None:
         self.log(message)
 
+    def _bar_tick_due(self, done: int, total: int) -> bool:
+        """True at most every PROGRESS_BAR_MIN_INTERVAL_MS, and always for the last step."""
+        now = time.monotonic_ns() // 1_000_000
+        if done < total and now - self._last_bar_tick < PROGRESS_BAR_MIN_INTERVAL_MS:
+            return False
+        self._last_bar_tick = now
+        return True
+
     def _on_worker_progress(self, done: int, total: int) -> None:
-        if total <= 0:
+        if total <= 0 or not self._bar_tick_due(done, total):
             return
         pct = int(done * 100 / total)
         # Conversion phase → 0–70 %
@@ -758,13 +882,15 @@ class SnapMergeApp(QtBaseClass):
         self.log(f"Merge phase started… {total_files} file(s) to append.")
 
     def _on_worker_merge_progress(self, done: int, total: int) -> None:
-        if total <= 0:
+        if total <= 0 or not self._bar_tick_due(done, total):
             return
-        if done == 1 or done == total or done % 10 == 0:
-            pct = int(done * 100 / total)
-            # Merge phase → 70–100 %
-            bar_pct = 70 + int(pct * 0.3)
-            self.ui.merge_progress_bar.setValue(bar_pct)
+        # The worker already coalesces these signals; only the final step
+        # is written to the log.
+        pct = int(done * 100 / total)
+        # Merge phase → 70–100 %
+        bar_pct = 70 + int(pct * 0.3)
+        self.ui.merge_progress_bar.setValue(bar_pct)
+        if done == total:
             self.log(f"Merge progress: {done}/{total} ({pct}%)")
 
     def _on_merge_finished(self, report: dict) -> None:
@@ -772,7 +898,7 @@ class SnapMergeApp(QtBaseClass):
         self.ui.merge_progress_bar.setValue(100)
         self._set_ui_enabled(True)
         self.log("Merge completed successfully.", "success")
-        self._cleanup_staging_dir()
+        self._cleanup_work_dirs()
 
         # Prefer the path reported by the pipeline, fallback to the last
         # one selected in the UI if not present.
@@ -804,7 +930,7 @@ class SnapMergeApp(QtBaseClass):
         """Called when MergeWorker emits an error."""
         self._set_ui_enabled(True)
         self.ui.merge_progress_bar.setVisible(False)
-        self._cleanup_staging_dir()
+        self._cleanup_work_dirs()
 
         self.log(f"Error during merge: {message}", "error")
         if tb:
@@ -823,7 +949,7 @@ class SnapMergeApp(QtBaseClass):
         self._set_ui_enabled(True)
         self.ui.merge_progress_bar.setVisible(False)
 
-        self._cleanup_staging_dir()
+        self._cleanup_work_dirs()
 
         QMessageBox.information(
             self,
@@ -841,31 +967,24 @@ class SnapMergeApp(QtBaseClass):
         self.log(message)
 
     def _on_doc_pages_progress(self, done: int, total: int) -> None:
-        # Shared toolbar while NOT performing a merge
-        self.ui.merge_progress_bar.setRange(0, total)
-        self.ui.merge_progress_bar.setValue(done)
+        # Shared toolbar while NOT performing a merge; its range was set
+        # when the job started
+        if self._bar_tick_due(done, total):
+            self.ui.merge_progress_bar.setValue(done)
 
     def _on_doc_pages_finished(self, pages_map: dict) -> None:
         # Actualizar cache y tabla
         for path_str, pages in pages_map.items():
             p = Path(path_str)
             self._doc_pages_cache[p] = pages
+            stamp = self._doc_stamps.get(p)
+            if stamp is not None:
+                self._doc_pages_store.put(p, stamp, pages)
+        self._doc_pages_store.save()
 
-        for row in range(self.table.rowCount()):
-            path_item = self.table.item(row, 5)
-            if path_item is None:
-                continue
-            row_path = Path(path_item.text()).resolve()
-            if row_path in self._doc_pages_cache:
-                pages = self._doc_pages_cache[row_path]
-                pages_item = self.table.item(row, 4)
-                if pages_item is None:
-                    pages_item = QTableWidgetItem()
-                    pages_item.setTextAlignment(Qt.AlignCenter)
-                    self.table.setItem(row, 4, pages_item)
-                pages_item.setText(str(pages))
-
-        self._recalculate_total_pages()
+        self._total_pages += self.files_model.update_pages(self._doc_pages_cache)
+
+        self._show_total_pages()
         self.log(
             f"Finished reading Word page counts for {len(pages_map)} document(s).",
             "success",
@@ -890,17 +1009,10 @@ class SnapMergeApp(QtBaseClass):
             event.ignore()
             return
 
-        # We accept the drag if at least one item is:
-        # - a file with a supported extension, or
-        # - a folder (we will process it in dropEvent)
+        # Accept as soon as one URL is a local file or folder; no stat() here.
+        # dropEvent does the real filtering (and logs if nothing matched).
         for url in mime.urls():
-            if not url.isLocalFile():
-                continue
-            p = Path(url.toLocalFile())
-            if p.is_dir():
-                event.acceptProposedAction()
-                return
-            if p.is_file() and p.suffix.lower() in self.settings.allowed_exts:
+            if url.isLocalFile():
                 event.acceptProposedAction()
                 return
 
@@ -916,17 +1028,24 @@ class SnapMergeApp(QtBaseClass):
         recursive = self.ui.include_subfolders_chk.isChecked()
         all_paths: List[Path] = []
         roots: List[Path] = []  # source folders
+        allowed = self.settings.allowed_ext_names
 
         for url in mime.urls():
             if not url.isLocalFile():
                 continue
-            p = Path(url.toLocalFile())
+            local = url.toLocalFile()
 
-            if p.is_dir():
+            # One stat() per URL; files are checked again (regular file,
+            # readable) by the probe workers in _append_files.
+            if os.path.isdir(local):
+                p = Path(local)
                 roots.append(p)
                 all_paths.extend(self._collect_files_from_folder(p, recursive))
+                continue
 
-            elif p.is_file() and p.suffix.lower() in self.settings.allowed_exts:
+            stem, _, ext = os.path.basename(local).rpartition(".")
+            if stem and ext.lower() in allowed:
+                p = Path(local)
                 roots.append(p.parent)
                 all_paths.append(p)
 
@@ -936,21 +1055,14 @@ class SnapMergeApp(QtBaseClass):
             return
 
         # Remove duplicate files while maintaining order
-        seen_files = set()
-        unique_paths: List[Path] = []
-        for p in all_paths:
-            if p not in seen_files:
-                seen_files.add(p)
-                unique_paths.append(p)
-
-        # Remove duplicate folders (for logging)
-        unique_roots: List[Path] = []
-        seen_roots = set()
-        for r in roots:
-            r_resolved = r.resolve()
-            if r_resolved not in seen_roots:
-                seen_roots.add(r_resolved)
-                unique_roots.append(r_resolved)
+        unique_paths: List[Path] = list(dict.fromkeys(all_paths))
+
+        # Remove duplicate folders (for logging). Files dropped together
+        # mostly share a parent, so dedupe before resolving: one resolve()
+        # per distinct folder instead of one per dropped file.
+        unique_roots: List[Path] = list(
+            dict.fromkeys(r.resolve() for r in dict.fromkeys(roots))
+        )
 
         # Logs
         self.log(f"Added {len(unique_paths)} file(s) from drag & drop.")
@@ -970,13 +1082,6 @@ class SnapMergeApp(QtBaseClass):
         event.acceptProposedAction()
         
     def closeEvent(self, event: QCloseEvent) -> None:
-        # Clean up staging in case there's anything pending
-        if self._current_staging_dir is not None:
-            try:
-                shutil.rmtree(self._current_staging_dir, ignore_errors=True)
-            except Exception:
-                pass
-
         # ALWAYS clean the .zip file's temperature settings upon exiting, without relying on Clean Work.
         if getattr(self, "_zip_temp_dirs", None):
             for d in self._zip_temp_dirs:
@@ -985,6 +1090,7 @@ class SnapMergeApp(QtBaseClass):
                 except Exception:
                     pass
             self._zip_temp_dirs.clear()
+        self._session_tmp.cleanup()
 
         super().closeEvent(event)
 
@@ -999,10 +1105,10 @@ class SnapMergeApp(QtBaseClass):
 
         filters = (
             f"Supported files ({ext_string});;"
-            f"Images ({' '.join('*' + e for e in self.settings._data['allowed_images'])});;"
-            f"Documents ({' '.join('*' + e for e in self.settings._data['allowed_docs'])});;"
-            f"Emails ({' '.join('*' + e for e in self.settings._data['allowed_emails'])});;"
-            f"Archives ({' '.join('*' + e for e in self.settings._data['allowed_zip'])});;"
+            f"Images ({' '.join('*' + e for e in self.settings.allowed_images)});;"
+            f"Documents ({' '.join('*' + e for e in self.settings.allowed_docs)});;"
+            f"Emails ({' '.join('*' + e for e in self.settings.allowed_emails)});;"
+            f"Archives ({' '.join('*' + e for e in self.settings.allowed_zip)});;"
             f"PDFs (*.pdf);;"
             "All files (*.*)"
         )
@@ -1023,6 +1129,7 @@ class SnapMergeApp(QtBaseClass):
             self,
             "Select folder to scan",
             str(Path.home()),
+            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseCustomDirectoryIcons,
         )
         if not folder:
             return
@@ -1031,64 +1138,80 @@ class SnapMergeApp(QtBaseClass):
         self.log(f"Folder selected: {folder_path}")
 
         recursive = self.ui.include_subfolders_chk.isChecked()
-        paths = self._collect_files_from_folder(folder_path, recursive)
+        self._start_folder_scan(folder_path, recursive)
 
-        if not paths:
-            self.log("No supported files found in this folder (or subfolders).", "warning")
-            QMessageBox.information(
-                self,
-                "SnapMerge",
-                "No supported files were found in the selected folder.",
-            )
-            return
+    def on_remove_selected(self) -> None:
+        # One index per selected row (not per cell), bottom-up so the
+        # remaining row numbers stay valid while deleting.
+        rows = sorted(
+            (idx.row() for idx in self.table.selectionModel().selectedRows()),
+            reverse=True,
+        )
 
-        self._append_files(sorted(paths))
-        scope = " and subfolders" if recursive else ""
-        self.log(f"Added {len(paths)} file(s) from folder{scope}: {folder_path.name}")
+        # Remove each contiguous run of rows with a single removeRows()
+        model = self.files_model
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            for row in model.rows[first:last + 1]:
+                self._forget_row(row)
+            model.removeRows(first, last - first + 1)
 
-    def on_remove_selected(self) -> None:
-        rows = sorted({idx.row() for idx in self.table.selectedIndexes()}, reverse=True)
-        for row in rows:
-            self.table.removeRow(row)
         if rows:
-            self._renumber_rows()
-            self._recalculate_total_pages()
+            self._show_total_pages()
             self.log(f"Removed {len(rows)} row(s).")
 
+    def _forget_row(self, row: FileRow) -> None:
+        """Drop a removed row from the page total and duplicate-detection state."""
+        self._total_pages -= row.pages or 0
+        signature = self._row_signatures.pop(row.path, None)
+        if signature is None:
+            return
+        self._signature_counts[signature] -= 1
+        if self._signature_counts[signature] <= 0:
+            del self._signature_counts[signature]
+
     def on_clear_all(self) -> None:
-        self.table.setRowCount(0)
-        self._recalculate_total_pages()
+        # Forget files that are still being probed
+        self._probe_epoch += 1
+        self._probe_done_seq = self._probe_next_seq
+        self._probe_results.clear()
+        self._probe_jobs.clear()
+        self._probe_rows = []
+        self._probe_timer.stop()
+        self._show_probe_busy()
+
+        self.files_model.clear()
+        self._row_signatures.clear()
+        self._signature_counts.clear()
+        self._total_pages = 0
+        self._show_total_pages()
         self.log("Cleared file list.")
 
     def move_row(self, direction: int) -> None:
-        """Move currently selected row up (-1) or down (+1)."""
-        row = self.table.currentRow()
-        if row < 0:
-            return
-
-        target = row + direction
-        if target < 0 or target >= self.table.rowCount():
-            return
-
-        for col in range(self.table.columnCount()):
-            src_item = self.table.takeItem(row, col)
-            dst_item = self.table.takeItem(target, col)
-            self.table.setItem(row, col, dst_item)
-            self.table.setItem(target, col, src_item)
+        """Move the selected rows (or the current one) up (-1) or down (+1)."""
+        rows = [i.row() for i in self.table.selectionModel().selectedRows()]
+        if not rows:
+            row = self.table.currentIndex().row()
+            if row < 0:
+                return
+            rows = [row]
 
-        self.table.selectRow(target)
-        self._renumber_rows()
+        # One layout change for the whole selection; the selection and the
+        # current index follow the rows through the persistent indexes.
+        self.files_model.shift_rows(rows, direction)
 
     def sort_by_name(self) -> None:
-        # Column 1 = Name
-        self.table.sortItems(1)
-        self._renumber_rows()
+        # Sorts the rows themselves (not a proxy view): the merge uses this order
+        self.files_model.sort(COL_NAME)
         self.log("Sorted by name.")
 
     def sort_by_type(self) -> None:
-        # Column 2 = Type
-        self.table.sortItems(2)
-        self._renumber_rows()
+        self.files_model.sort(COL_TYPE)
         self.log("Sorted by type.")
 
     # -------------------- Bottom area -------------------------------
@@ -1112,27 +1235,26 @@ class SnapMergeApp(QtBaseClass):
 
     def _collect_paths_from_table(self) -> List[Path]:
         """Return the file paths from the table in the current visible order."""
-        paths: List[Path] = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 5)  # Path column
-            if item is None:
-                continue
-            text = (item.text() or "").strip()
-            if not text:
-                continue
-            paths.append(Path(text))
-        return paths
+        return [row.path for row in self.files_model.rows]
 
 
     def on_merge_clicked(self) -> None:
         """Called when user clicks the Merge button.
 
-        This validates the inputs, stages the selected files into a
-        temporary folder in the same order as the table, and then
-        starts a background QThread (MergeWorker) so the UI stays
-        responsive while ``run_merge`` is executing.
+        This validates the inputs, takes the file paths straight from
+        the table model's rows (in table order), and then starts a
+        background QThread (MergeWorker) so the UI stays responsive
+        while ``run_manual_merge`` is executing.
         """
-        if self.table.rowCount() == 0:
+        if self._probe_jobs:
+            QMessageBox.information(
+                self,
+                "SnapMerge",
+                "Files are still being added. Please wait a moment and try again.",
+            )
+            return
+
+        if not self.files_model.rows:
             QMessageBox.warning(
                 self,
                 "SnapMerge",
@@ -1160,16 +1282,18 @@ class SnapMergeApp(QtBaseClass):
             )
             return
 
-        # Ensure parent directory exists
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-        except Exception as exc:  # noqa: BLE001
-            QMessageBox.critical(
-                self,
-                "SnapMerge",
-                f"Cannot create destination folder:\n{exc}",
-            )
-            return
+        # Ensure parent directory exists. The usual case (folder already
+        # there) costs one stat; mkdir walks the parent chain only if needed.
+        if not output_path.parent.is_dir():
+            try:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+            except Exception as exc:  # noqa: BLE001
+                QMessageBox.critical(
+                    self,
+                    "SnapMerge",
+                    f"Cannot create destination folder:\n{exc}",
+                )
+                return
 
         # Collect paths from the table in the visible order
         paths = self._collect_paths_from_table()
@@ -1204,52 +1328,37 @@ class SnapMergeApp(QtBaseClass):
         self.ui.merge_progress_bar.setValue(0)
         self.ui.merge_progress_bar.setVisible(True)
 
-        # Stage files into a temporary folder so that the pipeline can
-        # work over a single input_dir while preserving the table order.
+        # The pipeline takes the files in table order directly; no staging
+        # copies. Files deleted since they were added are left out.
         try:
-            staging_dir = Path(tempfile.mkdtemp(prefix="snapmerge_"))
-            staged_count = 0
+            files = [p for p in paths if p.exists()]
+            missing = len(paths) - len(files)
+            if missing:
+                self.log(f"Skipping {missing} missing file(s).", "warning")
 
-            for idx, src in enumerate(paths, start=1):
-                if not src.exists():
-                    self.log(f"Skipping missing file: {src}")
-                    continue
-
-                target_name = f"{idx:06d}_{src.name}"
-                dst = staging_dir / target_name
-                try:
-                    shutil.copy2(src, dst)
-                except Exception as copy_exc:  # noqa: BLE001
-                    self.log(f"Error copying {src} → {dst}: {copy_exc}", "error")
-                    continue
-                staged_count += 1
-
-            if staged_count == 0:
-                shutil.rmtree(staging_dir, ignore_errors=True)
+            if not files:
                 QMessageBox.warning(
                     self,
                     "SnapMerge",
-                    "No files could be staged for merging.\n"
+                    "None of the files in the list could be found.\n"
                     "Please check that the source files still exist.",
                 )
                 self._set_ui_enabled(True)
                 self.ui.merge_progress_bar.setVisible(False)
                 return
 
-            self.log(f"Staged {staged_count} file(s) for merge.")
-            self._current_staging_dir = staging_dir
-
             job = MergeJob(
-                input_dir=staging_dir,
                 output_pdf=output_path,
                 settings=self.settings,
+                files=files,
                 log_file=None,
+                # Converted PDFs are kept (size-bounded) for later merges,
+                # also after a restart
+                cache_dir=self._app_data_dir() / "converted",
             )
             self._start_merge_job(job)
 
         except Exception as exc:  # noqa: BLE001
-            if 'staging_dir' in locals():
-                shutil.rmtree(staging_dir, ignore_errors=True)
             self._set_ui_enabled(True)
             self.ui.merge_progress_bar.setVisible(False)
             self.log(f"Error preparing merge: {exc}")
@@ -1295,6 +1404,8 @@ def main():
     sys.excepthook = excepthook
 
     app = QApplication([])
+    # Names the per-user data folder (see SnapMergeApp._app_data_dir)
+    app.setApplicationName("SnapMerge")
     win = SnapMergeApp()
     win.show()
     sys.exit(app.exec())
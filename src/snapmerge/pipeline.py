@@ -1,18 +1,146 @@
 from __future__ import annotations
+import multiprocessing.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Iterator
 
 from snapmerge.services.eml_to_pdf import eml_to_pdf
 from snapmerge.services.file_names import get_original_file_name
 from .config import Settings
 from .logging_setup import get_logger
-from .types_job_types import JobSettings
-from .services.file_discovery import discover_files, filter_and_sort
+from .types_job_types import ExtKind, JobSettings
+from .services.file_discovery import filter_and_sort, scan_folder
 from .services.image_to_pdf import image_to_pdf
-from .services.docx_to_pdf import docx_to_pdf, DocxConversionError
-from .services.pdf_merge import merge_pdfs
+from .services.docx_to_pdf import docx_to_pdf, DocxConversionError, WordSession
+from .services.conversion_cache import ConversionCache
+from .services.pdf_merge import PdfMergeStream
 from .services.temp_utils import TempDir
 
+# (index, source, kind, output) of one file to convert before the merge
+_ConvertTask = tuple[int, Path, str, Path]
+
+# Below this many conversions the process pool's startup costs more than it saves
+CONVERT_POOL_MIN_TASKS = 4
+
+# Per-file "Processing ..." / "Merging: ..." status lines go out at most this
+# often (seconds); failures and phase messages are never dropped
+STATUS_LINE_MIN_INTERVAL = 0.05
+
+def _throttled(status_cb: Callable[[str], None] | None) -> Callable[[str], None] | None:
+    """Wrap status_cb so lines closer than STATUS_LINE_MIN_INTERVAL are dropped."""
+    if status_cb is None:
+        return None
+    last = float("-inf")
+
+    def emit(message: str) -> None:
+        nonlocal last
+        now = time.monotonic()
+        if now - last >= STATUS_LINE_MIN_INTERVAL:
+            last = now
+            status_cb(message)
+
+    return emit
+
+def _kinds_by_suffix(settings: Settings) -> dict[str, ExtKind]:
+    """Settings.ext_kinds without .zip, which only the window unpacks."""
+    return {ext: kind for ext, kind in settings.ext_kinds.items() if kind != "zip"}
+
+def _conversion_options(kind: str, job: JobSettings) -> tuple:
+    """Settings that change what _convert_file produces for this kind."""
+    if kind == "image":
+        return (job.image_margin_pts, job.max_image_dim_px)
+    return ()
+
+# Word instance shared by the doc conversions of this process: set around the
+# in-process loop of _convert_all, or once per pool worker (_init_convert_worker)
+_word_session: WordSession | None = None
+
+def _init_convert_worker() -> None:
+    """Pool initializer: one Word per worker process, started on its first doc."""
+    global _word_session
+    _word_session = WordSession()
+    # ProcessPoolExecutor has no per-worker teardown; multiprocessing runs
+    # finalizers with an exitpriority when the worker process exits.
+    multiprocessing.util.Finalize(_word_session, _word_session.close, exitpriority=10)
+
+def _size_or_zero(path: Path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+class _NotConverted(Exception):
+    """The converter reported failure (e.g. Word unavailable) without raising."""
+
+def _convert_file(kind: ExtKind, src: Path, outp: Path, margin_pts: int, max_dim_px: int) -> None:
+    """Convert one input to outp; runs in a pool process for large jobs."""
+    if kind == "image":
+        image_to_pdf(src, outp, margin_pts, max_dim_px)
+    elif kind == "doc":
+        if not (docx_to_pdf(src, outp, _word_session) and outp.exists()):
+            raise _NotConverted(str(src))
+    else:
+        eml_to_pdf(src, outp)
+
+def _convert_all(
+    tasks: list[_ConvertTask],
+    job: JobSettings,
+    status_cb: Callable[[str], None] | None,
+) -> Iterator[tuple[_ConvertTask, BaseException | None]]:
+    """
+    Run the conversions and yield (task, error or None) as each one ends.
+
+    With job.workers > 1 and enough tasks they run on a ProcessPoolExecutor
+    (image decoding, reportlab and Word are independent per file), so the
+    yield order is completion order; otherwise in order, in this process.
+    """
+    global _word_session
+
+    def announce(task: _ConvertTask) -> None:
+        _, src, kind, _ = task
+        if status_cb and kind == "doc":
+            status_cb(f"Converting Word → PDF: {get_original_file_name(src.name)}")
+        elif status_cb and kind == "eml":
+            status_cb(f"Converting Email → EML: {get_original_file_name(src.name)}")
+
+    args = (job.image_margin_pts, job.max_image_dim_px)
+    workers = min(max(1, job.workers), os.cpu_count() or 1, len(tasks))
+    if workers < 2 or len(tasks) < CONVERT_POOL_MIN_TASKS:
+        _word_session = WordSession()
+        try:
+            for task in tasks:
+                announce(task)
+                try:
+                    _convert_file(task[2], task[1], task[3], *args)
+                except Exception as exc:
+                    yield task, exc
+                else:
+                    yield task, None
+        finally:
+            _word_session.close()
+            _word_session = None
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_convert_worker)
+    try:
+        # Everything is queued at once, so a "Converting ..." line per file
+        # would all print up front; results are reported as they arrive.
+        if status_cb:
+            status_cb(f"Converting {len(tasks)} file(s) in {workers} processes...")
+        futures = {
+            pool.submit(_convert_file, task[2], task[1], task[3], *args): task
+            for task in tasks
+        }
+        for fut in as_completed(futures):
+            yield futures[fut], fut.exception()
+    finally:
+        # Also reached on cancel (the progress callback raises): drop
+        # conversions not started yet and wait for the running ones so
+        # the temp dir can be removed.
+        pool.shutdown(wait=True, cancel_futures=True)
+
 def run_merge(
     input_dir: Path,
     output_pdf: Path,
@@ -22,19 +150,16 @@ def run_merge(
     merge_start_cb: Callable[[int], None] | None = None,
     merge_progress_cb: Callable[[int, int], None] | None = None,
     log_file: Path | None = None,
+    cache_dir: Path | None = None,
 ) -> dict:
     """Run the end-to-end job from a folder (clasic mode)."""
     logger = get_logger(logfile=log_file)
     job: JobSettings = settings.as_job(input_dir, output_pdf)
 
-    allowed = (
-        (settings.get("allowed_pdfs") or [])
-        + (settings.get("allowed_images") or [])
-        + (settings.get("allowed_docs") or [])
-        + (settings.get("allowed_emails") or [])
-    )
+    # Same suffix map _run_core_from_files classifies with
+    allowed = list(_kinds_by_suffix(settings))
 
-    files = list(discover_files(job.input_dir, job.include_subfolders))
+    files = list(scan_folder(job.input_dir, allowed, job.include_subfolders))
     files = filter_and_sort(files, allowed, job.sort_by, job.sort_desc)
 
     return _run_core_from_files(
@@ -46,6 +171,7 @@ def run_merge(
         status_cb=status_cb,
         merge_start_cb=merge_start_cb,
         merge_progress_cb=merge_progress_cb,
+        cache=ConversionCache(cache_dir) if cache_dir else None,
     )
 
 def _run_core_from_files(
@@ -57,20 +183,19 @@ def _run_core_from_files(
     status_cb: Callable[[str], None] | None = None,
     merge_start_cb: Callable[[int], None] | None = None,
     merge_progress_cb: Callable[[int, int], None] | None = None,
+    cache: ConversionCache | None = None,
 ) -> dict:
     """Processes a list of already discovered and sorted files.
 
     This function contains ALL the logic for:
-    - converting images/docx to PDF
+    - converting images/docx to PDF (reusing cache entries when given)
     - accumulating PDFs to merge
-    - invoking merge_pdfs
+    - merging them in order (PdfMergeStream)
     - building the final report
     """
 
-    allowed_pdfs = settings.get("allowed_pdfs") or []
-    allowed_images = settings.get("allowed_images") or []
-    allowed_docs = settings.get("allowed_docs") or []
-    allowed_emails = settings.get("allowed_emails") or []
+    # Suffix -> "pdf"/"image"/"doc"/"eml", looked up once per file
+    kinds = _kinds_by_suffix(settings)
 
     to_merge: list[Path] = []
     skipped: list[Path] = []
@@ -82,74 +207,120 @@ def _run_core_from_files(
     if status_cb:
         status_cb(f"Discovered {total} file(s) to process.")
 
-    with TempDir() as tmp:
+    if cache and cache.root.is_dir():
+        # Converted PDFs are moved into the cache afterwards; converting on
+        # its filesystem keeps that a rename instead of a copy.
+        tmp_dir = TempDir(dir=cache.root)
+    else:
+        # Only pick a RAM-backed temp dir if the inputs that get converted
+        # would fit in it. A file that can't be stat'ed counts as 0 here
+        # and is skipped by its conversion below.
+        convert_bytes = sum(
+            _size_or_zero(f) for f in files if kinds.get(f.suffix.lower()) != "pdf"
+        )
+        tmp_dir = TempDir(min_free_bytes=convert_bytes)
+    with tmp_dir as tmp:
+        # idx -> file to merge in its place (None: skipped); PDFs go as-is,
+        # everything else is converted (possibly in parallel) first.
+        results: dict[int, Path | None] = {}
+        tasks: list[_ConvertTask] = []
+        # idx -> cache key of a conversion to store once it succeeds
+        cache_keys: dict[int, str] = {}
+
         for idx, f in enumerate(files, start=1):
-            if status_cb:
-                original_name = get_original_file_name(f.name)
-                status_cb(f"Processing ({idx}/{total}): {original_name}")
+            kind = kinds.get(f.suffix.lower())
+            if kind == "pdf":
+                results[idx] = f
+            elif kind is None:
+                results[idx] = None
+                skipped.append(f)
+            else:
+                key = cache.key(f, kind, *_conversion_options(kind, job)) if cache else None
+                hit = cache.get(key) if key else None
+                if not hit:
+                    if key:
+                        cache_keys[idx] = key
+                    # Inputs come from anywhere (not one staging folder), so two
+                    # of them may share a stem; the index keeps converted names apart.
+                    suffix = ".eml" if kind == "eml" else ".pdf"
+                    tasks.append((idx, f, kind, tmp.path / f"{idx:06d}_{f.stem}{suffix}"))
+                    continue
+                converted.append(hit)
+                results[idx] = hit
+            done += 1
+            if progress_cb:
+                progress_cb(done, total)
+
+        if converted and status_cb:
+            status_cb(f"Reusing {len(converted)} previously converted file(s).")
 
-            ext = f.suffix.lower()
-            try:
-                if ext in allowed_pdfs:
-                    to_merge.append(f)
+        # One line per file only matters when files are slow to process
+        file_status_cb = _throttled(status_cb)
+        with PdfMergeStream(status_cb, merging_cb=file_status_cb) as stream:
+            # Inputs before the first unfinished conversion are appended
+            # (parsed) while the remaining conversions still run.
+            next_idx = 1
+            for (idx, f, kind, outp), exc in _convert_all(tasks, job, status_cb):
+                original_name = get_original_file_name(f.name)
+                if file_status_cb:
+                    file_status_cb(f"Processing ({done + 1}/{total}): {original_name}")
 
-                elif ext in allowed_images:
-                    outp = tmp.path / (f.stem + ".pdf")
-                    image_to_pdf(f, outp, job.image_margin_pts, job.max_image_dim_px)
+                if exc is None:
+                    if kind == "doc" and status_cb:
+                        status_cb(f"Converted: {outp.name}")
+                    if idx in cache_keys:
+                        outp = cache.put(cache_keys[idx], outp)
                     converted.append(outp)
-                    to_merge.append(outp)
-
-                elif ext in allowed_docs:
-                    outp = tmp.path / (f.stem + ".pdf")
-                    if status_cb:
-                        status_cb(f"Converting Word → PDF: {original_name}")
-                    ok = docx_to_pdf(f, outp)
-                    if ok and outp.exists():
-                        converted.append(outp)
-                        to_merge.append(outp)
-                        if status_cb:
-                            status_cb(f"Converted: {outp.name}")
-                    else:
+                    results[idx] = outp
+                else:
+                    results[idx] = None
+                    skipped.append(f)
+                    if isinstance(exc, _NotConverted):
                         if status_cb:
                             status_cb(f"Can't Convert {original_name} to PDF")
                         logger.warning("Word not available or output missing. Skipping %s", f)
-                        skipped.append(f)
-                
-                elif ext in allowed_emails:
-                    outp = tmp.path / (f.stem + ".eml")
-                    if status_cb:
-                        status_cb(f"Converting Email → EML: {original_name}")
-                    eml_to_pdf(f, outp)
-                    converted.append(outp)
-                    to_merge.append(outp)
-                else:
-                    skipped.append(f)
+                    elif isinstance(exc, DocxConversionError):
+                        logger.error("DOCX conversion error for %s: %s", f, exc)
+                    else:
+                        logger.error("Processing error for %s: %s", f, exc)
 
-            except DocxConversionError as dce:
-                logger.error("DOCX conversion error for %s: %s", f, dce)
-                skipped.append(f)
-            except Exception as exc:
-                logger.error("Processing error for %s: %s", f, exc)
-                skipped.append(f)
-            finally:
                 done += 1
                 if progress_cb:
                     progress_cb(done, total)
 
-        if not to_merge:
-            raise RuntimeError("No eligible files found to merge.")
+                while next_idx in results:
+                    ready = results[next_idx]
+                    if ready is not None:
+                        stream.append(ready)
+                    next_idx += 1
 
-        if status_cb:
-            status_cb("Finalizing (writing PDF…)")
-        if merge_start_cb:
-            merge_start_cb(len(to_merge))
-
-        merge_pdfs(
-            to_merge,
-            job.output_pdf,
-            status_cb=status_cb,
-            progress_cb=merge_progress_cb,
-        )
+            # Table order, whatever order the conversions finished in
+            to_merge = [results[i] for i in sorted(results) if results[i] is not None]
+
+            if not to_merge:
+                raise RuntimeError("No eligible files found to merge.")
+
+            if status_cb:
+                status_cb("Finalizing (writing PDF…)")
+            if merge_start_cb:
+                merge_start_cb(len(to_merge))
+
+            # What was appended during the conversions counts as merged
+            merged = sum(1 for i in range(1, next_idx) if results[i] is not None)
+            if merged and merge_progress_cb:
+                merge_progress_cb(merged, len(to_merge))
+            for i in range(next_idx, total + 1):
+                if results[i] is None:
+                    continue
+                stream.append(results[i])
+                merged += 1
+                if merge_progress_cb:
+                    merge_progress_cb(merged, len(to_merge))
+
+            stream.write(job.output_pdf)
+
+    if cache:
+        cache.prune()
 
     report = {
         "input": str(job.input_dir),
@@ -173,6 +344,7 @@ def run_manual_merge(
     merge_start_cb: Callable[[int], None] | None = None,
     merge_progress_cb: Callable[[int, int], None] | None = None,
     log_file: Path | None = None,
+    cache_dir: Path | None = None,
 ) -> dict:
     """
     Perform the merge using an explicit file list (already defined order),
@@ -197,4 +369,5 @@ def run_manual_merge(
         status_cb=status_cb,
         merge_start_cb=merge_start_cb,
         merge_progress_cb=merge_progress_cb,
+        cache=ConversionCache(cache_dir) if cache_dir else None,
     )
\ No newline at end of file
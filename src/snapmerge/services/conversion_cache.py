@@ -0,0 +1,104 @@
+from __future__ import annotations
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+# Least recently used entries are removed once the cache grows past this
+CONVERSION_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+class ConversionCache:
+    """
+    PDFs produced by the converters, kept in a folder between merges.
+
+    Entries are keyed on the source file (resolved path, mtime_ns, size),
+    the kind of conversion and its options, so an edited source or a new
+    margin simply misses. Failures to read or write the cache are never
+    fatal; the file is just converted again. An entry's mtime records when
+    it was last used, which prune() evicts by.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = CONVERSION_CACHE_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # every get() misses and put() keeps the converted file
+
+    @staticmethod
+    def key(src: Path, kind: str, *options: object) -> Optional[str]:
+        """Cache key for converting src, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(src)
+            resolved = src.resolve()
+        except (OSError, ValueError):
+            return None
+        ident = "|".join(map(str, (resolved, st.st_mtime_ns, st.st_size, kind, *options)))
+        return hashlib.blake2b(ident.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[Path]:
+        """The cached PDF for key, if there is one."""
+        entry = self._entry(key)
+        try:
+            os.utime(entry)  # mark as recently used
+        except OSError:
+            return None
+        return entry
+
+    def put(self, key: str, produced: Path) -> Path:
+        """
+        Move a freshly converted PDF into the cache and return where it is.
+
+        Entries only ever appear complete (rename, or copy + os.replace,
+        after which produced is removed). If the cache can't take it,
+        produced is returned unchanged.
+        """
+        entry = self._entry(key)
+        try:
+            os.replace(produced, entry)
+            return entry
+        except OSError:
+            pass  # e.g. the temp dir is on another drive
+
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(produced, tmp)
+            os.replace(tmp, entry)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return produced
+        try:
+            produced.unlink()  # don't keep a second copy until the job ends
+        except OSError:
+            pass
+        return entry
+
+    def prune(self) -> None:
+        """Delete the least recently used entries past max_bytes."""
+        entries = []
+        try:
+            with os.scandir(self.root) as it:
+                for e in it:
+                    if e.name.endswith(".pdf") and e.is_file():
+                        st = e.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, e.path))
+        except OSError:
+            return
+
+        excess = sum(size for _, size, _ in entries) - self.max_bytes
+        for _, size, path in sorted(entries):
+            if excess <= 0:
+                break
+            try:
+                os.remove(path)
+                excess -= size
+            except OSError:
+                pass  # in use (Windows) or already gone
@@ -5,14 +5,38 @@ import sys
 class DocMigrationError(RuntimeError):
     pass
 
-def doc_to_docx_via_word(inp: Path, out_docx: Path) -> bool:
+def _save_as_docx(word, inp: Path, out_docx: Path) -> bool:
+    """Open inp in a running Word and save it as .docx (SaveAs2, FileFormat=12)."""
+    # Open without confirming conversions (for .doc 97-2003)
+    doc = word.Documents.Open(
+        str(inp), ReadOnly=True, ConfirmConversions=False, AddToRecentFiles=False
+    )
+    try:
+        out_docx.parent.mkdir(parents=True, exist_ok=True)
+        wdFormatXMLDocument = 12  # .docx
+        # SaveAs2 is the MS supported way for new extensions
+        doc.SaveAs2(str(out_docx), FileFormat=wdFormatXMLDocument)
+    finally:
+        doc.Close(0)  # wdDoNotSaveChanges
+    return out_docx.exists()
+
+def doc_to_docx_via_word(inp: Path, out_docx: Path, word=None) -> bool:
     """
     Attempts to convert a .doc (or .docx) file to a .docx file using Microsoft Word/COM
     (SaveAs2 with FileFormat=12). Returns True if the .docx file was created.
+
+    word: an already running Word.Application to use (e.g. WordSession.app);
+    by default a Word instance is started and quit just for this file.
     """
     if sys.platform != "win32":
         return False
 
+    if word is not None:
+        try:
+            return _save_as_docx(word, inp, out_docx)
+        except Exception as exc:
+            raise DocMigrationError(f"Failed to migrate '{inp.name}' to .docx: {exc}")
+
     try:
         import pythoncom
         import win32com.client
@@ -28,19 +52,10 @@ def doc_to_docx_via_word(inp: Path, out_docx: Path) -> bool:
         word = win32com.client.DispatchEx("Word.Application")
         word.Visible = False
         word.DisplayAlerts = 0  # wdAlertsNone
-
-        # Open without confirming conversions (for .doc 97-2003)
-        doc = word.Documents.Open(str(inp), ReadOnly=True, ConfirmConversions=False)
         try:
-            out_docx.parent.mkdir(parents=True, exist_ok=True)
-            wdFormatXMLDocument = 12  # .docx
-            # SaveAs2 is the MS supported way for new extensions
-            doc.SaveAs2(str(out_docx), FileFormat=wdFormatXMLDocument)
+            return _save_as_docx(word, inp, out_docx)
         finally:
-            doc.Close(0)  # wdDoNotSaveChanges
             word.Quit()
-
-        return out_docx.exists()
     except Exception as exc:
         raise DocMigrationError(f"Failed to migrate '{inp.name}' to .docx: {exc}")
 
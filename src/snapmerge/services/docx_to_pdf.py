@@ -19,71 +19,131 @@ def _patch_win32com_genpy_to_temp():
     _sys.modules["win32com.gen_py"] = importlib.import_module("win32com.gen_py")
 
 
-def _export_to_pdf_with_word(inp: Path, out_pdf: Path) -> None:
-    try:
-        import pythoncom, win32com.client  # type: ignore
-        from pythoncom import com_error
-    except Exception as e:
-        raise DocxConversionError(f"pywin32/Word COM no disponible: {e}")
-
-    _patch_win32com_genpy_to_temp()  # <-- clave para ejecutable congelado
-
-    co_init = False
-    try:
-        pythoncom.CoInitialize()
-        co_init = True
+class WordSession:
+    """
+    Una instancia oculta de Word reutilizada para varias conversiones.
 
-        word = win32com.client.DispatchEx("Word.Application")
-        word.Visible = False
-        word.DisplayAlerts = 0  # wdAlertsNone
+    Word solo se arranca al usar .app por primera vez (sin docs, o fuera de
+    Windows, no cuesta nada) y se cierra con close() o al salir del bloque
+    with. Usar desde el mismo hilo que la creó (COM).
+    """
 
-        # Rutas simples
-        inp_str = str(inp)
-        out_pdf.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(self) -> None:
+        self._word = None
+        self._co_init = False
 
-        # Abrimos sin diálogos de conversión (para .doc antiguos)
-        doc = word.Documents.Open(inp_str, ReadOnly=True, ConfirmConversions=False)
-        try:
-            # ExportAsFixedFormat es más estable que SaveAs para .doc
-            wdExportFormatPDF = 17
-            wdExportOptimizeForPrint = 0
-            wdExportAllDocument = 0
-            wdExportDocumentContent = 0
-            wdExportCreateHeadingBookmarks = 1
-
-            doc.ExportAsFixedFormat(
-                OutputFileName=str(out_pdf),
-                ExportFormat=wdExportFormatPDF,
-                OpenAfterExport=False,
-                OptimizeFor=wdExportOptimizeForPrint,
-                Range=wdExportAllDocument,
-                From=1, To=1,
-                Item=wdExportDocumentContent,
-                IncludeDocProps=True,
-                KeepIRM=True,
-                CreateBookmarks=wdExportCreateHeadingBookmarks,
-                DocStructureTags=True,
-                BitmapMissingFonts=True,
-                UseISO19005_1=False,
-            )
-        finally:
-            doc.Close(0)
-            word.Quit()
-
-        if not out_pdf.exists():
-            raise DocxConversionError("Word no generó el PDF (sin excepción).")
-    finally:
-        if co_init:
+    @property
+    def app(self):
+        """Word.Application (DispatchEx), arrancado la primera vez."""
+        if self._word is None:
+            try:
+                import pythoncom, win32com.client  # type: ignore
+            except Exception as e:
+                raise DocxConversionError(f"pywin32/Word COM no disponible: {e}")
+
+            _patch_win32com_genpy_to_temp()  # <-- clave para ejecutable congelado
+
+            pythoncom.CoInitialize()
+            self._co_init = True
+            word = win32com.client.DispatchEx("Word.Application")
+            word.Visible = False
+            word.DisplayAlerts = 0  # wdAlertsNone
+            self._word = word
+        return self._word
+
+    def close(self) -> None:
+        """Cierra Word (si se arrancó); el próximo .app abre uno nuevo."""
+        word, self._word = self._word, None
+        if word is not None:
+            try:
+                word.Quit()
+            except Exception:
+                pass
+        if self._co_init:
+            self._co_init = False
             try:
+                import pythoncom  # type: ignore
                 pythoncom.CoUninitialize()
             except Exception:
                 pass
 
+    def __enter__(self) -> "WordSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
-def docx_to_pdf(inp: Path, out_pdf: Path) -> bool:
+
+def _export_to_pdf_with_word(inp: Path, out_pdf: Path, session: WordSession | None = None) -> None:
+    if session is None:
+        with WordSession() as own:
+            _export_to_pdf_with_word(inp, out_pdf, own)
+        return
+
+    word = session.app
+
+    # Rutas simples
+    inp_str = str(inp)
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+
+    # Abrimos sin diálogos de conversión (para .doc antiguos); sin MRU ni
+    # ventana, la instancia puede servir muchos documentos
+    doc = word.Documents.Open(
+        inp_str,
+        ReadOnly=True,
+        ConfirmConversions=False,
+        AddToRecentFiles=False,
+        Visible=False,
+    )
+    try:
+        # ExportAsFixedFormat es más estable que SaveAs para .doc
+        wdExportFormatPDF = 17
+        wdExportOptimizeForPrint = 0
+        wdExportAllDocument = 0
+        wdExportDocumentContent = 0
+        wdExportCreateHeadingBookmarks = 1
+
+        doc.ExportAsFixedFormat(
+            OutputFileName=str(out_pdf),
+            ExportFormat=wdExportFormatPDF,
+            OpenAfterExport=False,
+            OptimizeFor=wdExportOptimizeForPrint,
+            Range=wdExportAllDocument,
+            From=1, To=1,
+            Item=wdExportDocumentContent,
+            IncludeDocProps=True,
+            KeepIRM=True,
+            CreateBookmarks=wdExportCreateHeadingBookmarks,
+            DocStructureTags=True,
+            BitmapMissingFonts=True,
+            UseISO19005_1=False,
+        )
+    finally:
+        doc.Close(0)
+
+    if not out_pdf.exists():
+        raise DocxConversionError("Word no generó el PDF (sin excepción).")
+
+
+def _export_doc_via_docx(inp: Path, out_pdf: Path, session: WordSession | None) -> None:
+    """Migra un .doc a un .docx temporal (SaveAs2) y exporta ese a PDF."""
+    from .doc_migrate import doc_to_docx_via_word
+    from tempfile import TemporaryDirectory
+    with TemporaryDirectory(prefix="snapmerge_mig_") as td:
+        tmp_docx = Path(td) / (inp.stem + ".docx")
+        ok = doc_to_docx_via_word(
+            inp, tmp_docx, word=session.app if session else None
+        )
+        if not ok or not tmp_docx.exists():
+            raise DocxConversionError("Migración .doc → .docx falló.")
+        _export_to_pdf_with_word(tmp_docx, out_pdf, session)
+
+
+def docx_to_pdf(inp: Path, out_pdf: Path, session: WordSession | None = None) -> bool:
     """
     Convierte .doc o .docx a PDF con Word/COM.
     En EXE evita docx2pdf y usa COM directo con cache en %TEMP%.
+    Con session, reutiliza su instancia de Word en vez de abrir una por archivo.
     """
     if sys.platform != "win32":
         return False
@@ -93,19 +153,19 @@ def docx_to_pdf(inp: Path, out_pdf: Path) -> bool:
         return False
 
     try:
-        # Si es .doc, primero migrarlo a .docx con tu método (opcional)
-        if ext == ".doc":
-            from .doc_migrate import doc_to_docx_via_word
-            from tempfile import TemporaryDirectory
-            with TemporaryDirectory(prefix="snapmerge_mig_") as td:
-                tmp_docx = Path(td) / (inp.stem + ".docx")
-                ok = doc_to_docx_via_word(inp, tmp_docx)
-                if not ok or not tmp_docx.exists():
-                    raise DocxConversionError("Migración .doc → .docx falló.")
-                _export_to_pdf_with_word(tmp_docx, out_pdf)
-        else:
-            _export_to_pdf_with_word(inp, out_pdf)
+        try:
+            # Word abre los .doc directamente: exportamos sin migrar primero
+            _export_to_pdf_with_word(inp, out_pdf, session)
+        except Exception:
+            if ext != ".doc":
+                raise
+            # Plan B para .doc: migrarlo a .docx y exportar ese
+            _export_doc_via_docx(inp, out_pdf, session)
 
         return out_pdf.exists()
     except Exception:
+        if session is not None:
+            # Word puede haber muerto o quedado colgado: el próximo archivo
+            # arranca una instancia nueva
+            session.close()
         return False
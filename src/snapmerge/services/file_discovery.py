@@ -1,18 +1,35 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 import os
 
-def discover_files(root: Path, include_subfolders: bool) -> Iterable[Path]:
-    """Yield all files under root (optionally including subfolders)."""
-    if include_subfolders:
-        for dirpath, _, filenames in os.walk(root):
-            for fn in filenames:
-                yield Path(dirpath) / fn
-    else:
-        for p in root.iterdir():
-            if p.is_file():
-                yield p
+def scan_folder(root: Path, allowed_exts: Iterable[str], recursive: bool) -> Iterator[Path]:
+    """
+    Yield files under root whose (lowercase) extension is in allowed_exts.
+
+    Uses os.scandir so the file/dir checks come from the directory entry
+    instead of one stat() per candidate; Path objects are only built for
+    files that pass the extension filter. Symlinked folders are not
+    descended into.
+    """
+    # Compare against extensions without the dot so the name only needs a
+    # rpartition; a name with nothing before the last dot has no suffix.
+    allowed = frozenset(e.lower().lstrip(".") for e in allowed_exts)
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                    continue
+                stem, _, ext = entry.name.rpartition(".")
+                if stem and ext.lower() in allowed and entry.is_file():
+                    yield Path(entry.path)
 
 def filter_and_sort(
 files: Iterable[Path],
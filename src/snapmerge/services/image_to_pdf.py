@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 from pathlib import Path
 from PIL import Image
 
@@ -39,24 +40,34 @@ def image_to_pdf(
     - Allows upscaling of small images up to max_upscale times,
       but never larger than the usable area of ​​the page.
     """
+    page_w, page_h = PAGE_WIDTH_PX, PAGE_HEIGHT_PX
+    margin = max(int(margin_pts), 0)
+
+    # 2) Usable area within the margins (computed first: step 0 needs it)
+    inner_w = page_w - 2 * margin
+    inner_h = page_h - 2 * margin
+    if inner_w <= 0 or inner_h <= 0:
+        # If the margin got out of hand, we ignore it.
+        inner_w, inner_h = page_w, page_h
+        margin = 0
+
     with Image.open(image_path) as img:
+        # 0) JPEGs can be decoded at 1/2, 1/4 or 1/8 size. Ask for the most
+        # reduced one still at least as big as the image ends up on the page,
+        # so e.g. a 24 MP photo isn't fully decoded only to be scaled down
+        # below. Other formats ignore draft().
+        src_w, src_h = img.size
+        fit = min(inner_w / src_w, inner_h / src_h)
+        if max_dim > 0:
+            fit = min(fit, max_dim / max(src_w, src_h))
+        if fit < 1.0:
+            img.draft("RGB", (math.ceil(src_w * fit), math.ceil(src_h * fit)))
         img = img.convert("RGB")
 
         # 1) Reduce absurdly large images first.
         if max_dim > 0:
             img = _downscale(img, max_dim)
 
-        page_w, page_h = PAGE_WIDTH_PX, PAGE_HEIGHT_PX
-        margin = max(int(margin_pts), 0)
-
-        # 2) Usable area within the margins
-        inner_w = page_w - 2 * margin
-        inner_h = page_h - 2 * margin
-        if inner_w <= 0 or inner_h <= 0:
-            # If the margin got out of hand, we ignore it.
-            inner_w, inner_h = page_w, page_h
-            margin = 0
-
         img_w, img_h = img.size
 
         # 3) Scale factor to fit within the usable rectangle
@@ -0,0 +1,71 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# (mtime_ns, size) of the file when its pages were counted
+Stamp = Tuple[int, int]
+
+# Oldest (least recently used) entries are dropped past this count
+PAGE_COUNT_CACHE_MAX = 10_000
+
+class PageCountCache:
+    """
+    Page counts persisted in a JSON file, keyed on (path, mtime_ns, size).
+
+    Meant for counts that are expensive to get (Word COM): a file edited
+    since it was counted gets a new stamp and simply misses. Writes are
+    best effort; a missing or broken file just starts an empty cache.
+    """
+
+    def __init__(self, file: Optional[Path], max_entries: int = PAGE_COUNT_CACHE_MAX) -> None:
+        self._file = file
+        self._max_entries = max_entries
+        self._entries: Dict[Tuple[str, int, int], int] = {}
+        self._dirty = False
+        if file is not None:
+            self._load(file)
+
+    def _load(self, file: Path) -> None:
+        try:
+            rows = json.loads(file.read_bytes())["entries"]
+            for path_str, mtime_ns, size, pages in rows:
+                self._entries[(path_str, int(mtime_ns), int(size))] = int(pages)
+        except (OSError, ValueError, TypeError, KeyError):
+            self._entries.clear()
+
+    def get(self, path: Path, stamp: Stamp) -> Optional[int]:
+        key = (str(path), *stamp)
+        pages = self._entries.pop(key, None)
+        if pages is not None:
+            self._entries[key] = pages  # move to the recently used end
+        return pages
+
+    def put(self, path: Path, stamp: Stamp, pages: int) -> None:
+        key = (str(path), *stamp)
+        self._entries.pop(key, None)
+        self._entries[key] = pages
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache (temp file + os.replace) if anything changed."""
+        if self._file is None or not self._dirty:
+            return
+        excess = len(self._entries) - self._max_entries
+        if excess > 0:
+            for key in list(self._entries)[:excess]:
+                del self._entries[key]
+
+        rows = [[p, mtime_ns, size, pages] for (p, mtime_ns, size), pages in self._entries.items()]
+        tmp = self._file.with_name(f"{self._file.name}.{os.getpid()}.tmp")
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"entries": rows}), encoding="utf-8")
+            os.replace(tmp, self._file)
+            self._dirty = False
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
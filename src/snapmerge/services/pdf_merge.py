@@ -1,10 +1,62 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Callable, Optional
-from PyPDF2 import PdfMerger
+from PyPDF2 import PdfReader, PdfWriter
 
 from snapmerge.services.file_names import get_original_file_name
 
+class PdfMergeStream:
+    """
+    Append PDFs one at a time, then write them out as one file.
+
+    Lets the pipeline parse inputs that are ready while later ones are
+    still being converted; merge_pdfs() is the all-at-once form. Pages are
+    copied into the writer on append, so each input is closed (and its
+    reader dropped) right away instead of staying open until write().
+    """
+
+    def __init__(
+        self,
+        status_cb: Callable[[str], None] | None = None,
+        merging_cb: Callable[[str], None] | None = None,
+    ) -> None:
+        self._writer = PdfWriter()
+        self._status_cb = status_cb
+        # Per-file "Merging: ..." lines (e.g. throttled); default status_cb
+        self._merging_cb = merging_cb or status_cb
+
+    def append(self, p: Path) -> bool:
+        """Append one PDF; False (and a status message) if it can't be read."""
+        original_name = get_original_file_name(p.name)
+        if self._merging_cb:
+            self._merging_cb(f"Merging: {original_name}")
+        try:
+            with p.open("rb") as fh:
+                reader = PdfReader(fh, strict=False)
+                # Fail on unreadable/encrypted input before any page is added
+                len(reader.pages)
+                self._writer.append(reader)
+            return True
+        except Exception as e:
+            # Skip problematic file but continue
+            if self._status_cb:
+                self._status_cb(f"Skipping (unreadable/encrypted): {original_name} — {e}")
+            return False
+
+    def write(self, out_pdf: Path) -> None:
+        out_pdf.parent.mkdir(parents=True, exist_ok=True)
+        with out_pdf.open("wb") as fh:
+            self._writer.write(fh)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "PdfMergeStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 def merge_pdfs(inputs: list[Path], out_pdf: Path, 
                status_cb: Callable[[str], None] | None = None,
                progress_cb: Callable[[int, int], None] | None = None) -> None:
@@ -12,27 +64,10 @@ def merge_pdfs(inputs: list[Path], out_pdf: Path,
     Merge PDFs with optional per-file progress callback.
     progress_cb(done, total) is called for each appended PDF.
     """
-    merger = PdfMerger()
-    try:
+    with PdfMergeStream(status_cb) as stream:
         total = len(inputs)
-        done = 0
-        for p in inputs:
-            if status_cb:
-                original_name = get_original_file_name(p.name)
-                status_cb(f"Merging: {original_name}")
-            try:                               
-                merger.append(str(p))        
-            except Exception as e:
-                # Skip problematic file but continue
-                if status_cb:
-                    status_cb(f"Skipping (unreadable/encrypted): {original_name} — {e}")
-            finally:
-                done += 1
-                if progress_cb:
-                    progress_cb(done, total)
-                    
-        out_pdf.parent.mkdir(parents=True, exist_ok=True)
-        with out_pdf.open("wb") as fh:
-            merger.write(fh)
-    finally:
-        merger.close()
\ No newline at end of file
+        for done, p in enumerate(inputs, start=1):
+            stream.append(p)
+            if progress_cb:
+                progress_cb(done, total)
+        stream.write(out_pdf)
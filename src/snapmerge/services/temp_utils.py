@@ -1,11 +1,50 @@
 from __future__ import annotations
 from pathlib import Path
+import os
 import tempfile
 import shutil
 
+# Environment variable naming a folder (e.g. a ramdisk) for SnapMerge's temp files
+TMPDIR_ENV = "SNAPMERGE_TMPDIR"
+
+# Memory-backed folders tried (Linux) before the system temp folder
+_RAM_TEMP_CANDIDATES = ("/dev/shm", os.environ.get("XDG_RUNTIME_DIR") or "")
+
+def pick_temp_root(min_free_bytes: int = 0, prefer_ram: bool = True) -> str | None:
+    """
+    Folder to create SnapMerge temp dirs in; None means the system default.
+
+    $SNAPMERGE_TMPDIR wins when it is a writable folder. Otherwise, with
+    prefer_ram, a writable tmpfs (/dev/shm, $XDG_RUNTIME_DIR) with at least
+    min_free_bytes free is used, so staged/converted files stay in memory.
+    """
+    configured = os.environ.get(TMPDIR_ENV)
+    if configured and os.path.isdir(configured) and os.access(configured, os.W_OK):
+        return configured
+    if not prefer_ram:
+        return None
+
+    for candidate in _RAM_TEMP_CANDIDATES:
+        if not candidate or not os.path.isdir(candidate) or not os.access(candidate, os.W_OK):
+            continue
+        try:
+            if shutil.disk_usage(candidate).free >= min_free_bytes:
+                return candidate
+        except OSError:
+            continue
+    return None
+
 class TempDir:
-    def __init__(self, prefix: str = "snapmerge_"):
-        self._path = Path(tempfile.mkdtemp(prefix=prefix))
+    def __init__(
+        self,
+        prefix: str = "snapmerge_",
+        min_free_bytes: int = 0,
+        prefer_ram: bool = True,
+        dir: Path | None = None,
+    ):
+        # An explicit dir (e.g. next to the files will be moved to) skips the lookup
+        root = dir if dir is not None else pick_temp_root(min_free_bytes, prefer_ram)
+        self._path = Path(tempfile.mkdtemp(prefix=prefix, dir=root))
 
     @property
     def path(self) -> Path:
@@ -19,4 +58,4 @@ class TempDir:
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self.cleanup()
\ No newline at end of file
+        self.cleanup()
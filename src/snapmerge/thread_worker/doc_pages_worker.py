@@ -1,9 +1,111 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from PySide6.QtCore import QObject, Signal, Slot
 
+# Batches larger than this are split across several Word processes
+WORD_PARALLEL_MIN_DOCS = 8
+# Word itself stops scaling at about this many concurrent instances
+WORD_MAX_INSTANCES = 4
+
+def _patch_genpy() -> None:
+    # same patch you use in docx_to_pdf
+    try:
+        from snapmerge.services.docx_to_pdf import _patch_win32com_genpy_to_temp
+        try:
+            _patch_win32com_genpy_to_temp()
+        except Exception:
+            pass
+    except Exception:
+        pass
+
+def count_pages_with_word(
+    paths: List[str],
+    on_doc: Optional[Callable[[int, str], None]] = None,
+) -> Dict[str, int]:
+    """
+    Count pages of every document in paths with a single Word instance.
+
+    on_doc(index, path) is called before each document is opened. Documents
+    Word can't open (or report 0 pages for) are left out of the result.
+    Runs in the worker thread, or in a pool process for large batches.
+    """
+    import pythoncom  # type: ignore
+    import win32com.client  # type: ignore
+
+    _patch_genpy()
+
+    result: Dict[str, int] = {}
+    word = None
+    co_init = False
+    try:
+        pythoncom.CoInitialize()
+        co_init = True
+
+        word = win32com.client.DispatchEx("Word.Application")
+        word.Visible = False
+        word.DisplayAlerts = 0  # wdAlertsNone
+
+        for idx, doc_path in enumerate(paths, start=1):
+            if on_doc is not None:
+                on_doc(idx, doc_path)
+
+            try:
+                # No MRU entry and no document window: this instance is
+                # reused for every path, so keep each Open as light as possible
+                doc = word.Documents.Open(
+                    doc_path,
+                    ReadOnly=True,
+                    ConfirmConversions=False,
+                    AddToRecentFiles=False,
+                    Visible=False,
+                )
+            except Exception:
+                continue
+
+            pages = None
+            try:
+                # 1) Built-in property
+                try:
+                    props = doc.BuiltInDocumentProperties
+                    pages = int(props("Number of Pages"))
+                except Exception:
+                    pages = None
+
+                # 2) Fallback: ComputeStatistics
+                if pages is None:
+                    try:
+                        wdStatisticPages = 2  # pages
+                        pages = int(doc.ComputeStatistics(wdStatisticPages))
+                    except Exception:
+                        pages = None
+
+                if pages is not None and pages > 0:
+                    result[doc_path] = pages
+
+            finally:
+                try:
+                    doc.Close(False)
+                except Exception:
+                    pass
+
+    finally:
+        try:
+            if word is not None:
+                word.Quit()
+        except Exception:
+            pass
+
+        if co_init:
+            try:
+                pythoncom.CoUninitialize()
+            except Exception:
+                pass
+
+    return result
+
 class DocPagesWorker(QObject):
     """Worker that reads Word document pages in a QThread."""
 
@@ -31,86 +133,53 @@ class DocPagesWorker(QObject):
             self.error.emit("pywin32 not available", repr(exc))
             return
 
-        # same patch you use in docx_to_pdf
-        try:
-            from snapmerge.services.docx_to_pdf import _patch_win32com_genpy_to_temp
-            try:
-                _patch_win32com_genpy_to_temp()
-            except Exception:
-                pass
-        except Exception:
-            pass
+        total = len(self._paths)
+        if total == 0:
+            self.finished.emit(result)
+            return
 
-        word = None
-        co_init = False
+        paths = [str(p) for p in self._paths]
         try:
-            pythoncom.CoInitialize()
-            co_init = True
-
-            total = len(self._paths)
-            if total == 0:
-                self.finished.emit(result)
-                return
-
-            word = win32com.client.DispatchEx("Word.Application")
-            word.Visible = False
-            word.DisplayAlerts = 0  # wdAlertsNone
-
-            for idx, doc_path in enumerate(self._paths, start=1):
-                self.progress.emit(idx, total)
-                self.status.emit(f"Reading pages: {doc_path.name}")
-
-                try:
-                    doc = word.Documents.Open(
-                        str(doc_path),
-                        ReadOnly=True,
-                        ConfirmConversions=False,
-                    )
-                except Exception:
-                    continue
-
-                pages = None
-                try:
-                    # 1) Built-in property
-                    try:
-                        props = doc.BuiltInDocumentProperties
-                        pages = int(props("Number of Pages"))
-                    except Exception:
-                        pages = None
-
-                    # 2) Fallback: ComputeStatistics
-                    if pages is None:
-                        try:
-                            wdStatisticPages = 2  # pages
-                            pages = int(doc.ComputeStatistics(wdStatisticPages))
-                        except Exception:
-                            pages = None
-
-                    if pages is not None and pages > 0:
-                        result[str(doc_path)] = pages
+            if total > WORD_PARALLEL_MIN_DOCS:
+                result = self._count_in_processes(paths)
+            else:
+                def on_doc(idx: int, doc_path: str) -> None:
+                    self.progress.emit(idx, total)
+                    self.status.emit(f"Reading pages: {Path(doc_path).name}")
 
-                finally:
-                    try:
-                        doc.Close(False)
-                    except Exception:
-                        pass
+                result = count_pages_with_word(paths, on_doc)
 
         except Exception as exc:
             tb = traceback.format_exc()
             self.error.emit(str(exc), tb)
             return
 
-        finally:
-            try:
-                if word is not None:
-                    word.Quit()
-            except Exception:
-                pass
+        self.finished.emit(result)
 
-            if co_init:
-                try:
-                    pythoncom.CoUninitialize()
-                except Exception:
-                    pass
+    def _count_in_processes(self, paths: List[str]) -> Dict[str, int]:
+        """
+        Split a large batch over a few Word processes.
 
-        self.finished.emit(result)
\ No newline at end of file
+        Word COM is process-local, so each pool process starts its own
+        Word.Application and counts one contiguous share of the paths with
+        it (one Word startup per process, not per document).
+        """
+        total = len(paths)
+        instances = min(WORD_MAX_INSTANCES, -(-total // WORD_PARALLEL_MIN_DOCS))
+        share = -(-total // instances)
+        chunks = [paths[i:i + share] for i in range(0, total, share)]
+
+        self.status.emit(
+            f"Reading pages of {total} document(s) with {len(chunks)} Word instances"
+        )
+        self.progress.emit(0, total)
+
+        result: Dict[str, int] = {}
+        done = 0
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = {pool.submit(count_pages_with_word, chunk): chunk for chunk in chunks}
+            for fut in as_completed(futures):
+                result.update(fut.result())
+                done += len(futures[fut])
+                self.progress.emit(done, total)
+        return result
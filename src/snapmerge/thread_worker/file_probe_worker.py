@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from snapmerge.types_job_types import ExtKind
+
+# Paths are probed (and handed back to the GUI thread) in chunks of this size
+PROBE_CHUNK_SIZE = 32
+
+# (mtime_ns, size) -> (is_encrypted, pages), per resolved PDF path
+PdfMetaCache = Dict[Path, Tuple[Tuple[int, int], Tuple[bool, Optional[int]]]]
+
+@dataclass
+class FileProbe:
+    """What the file list needs to know about one dropped path."""
+
+    path: Path
+    resolved: Optional[Path] = None     # None: missing or not a regular file
+    ext: str = ""                       # lowercase, without the dot
+    kind: Optional[ExtKind] = None
+    size_bytes: int = 0
+    stamp: Tuple[int, int] = (0, 0)     # (mtime_ns, size)
+    pages: Optional[int] = None
+    encrypted: bool = False
+    error: Optional[str] = None         # set when a PDF (or the probe) fails
+
+def read_pdf_meta(path: Path) -> Tuple[bool, Optional[int]]:
+    """
+    Return (is_encrypted, page_count) for a PDF with a single reader.
+    Raises if the PDF can't be opened; page count is None when it can't
+    be read (or the file is encrypted).
+    """
+    from PyPDF2 import PdfReader
+    reader = PdfReader(str(path), strict=False)
+
+    # Some versions use .is_encrypted, others .encrypted
+    encrypted = bool(getattr(reader, "is_encrypted", False))
+    pages: Optional[int] = None
+    if not encrypted:
+        try:
+            pages = len(reader.pages)
+        except Exception:
+            pages = None
+    return encrypted, pages
+
+def probe_file(
+    path: Path,
+    ext_kind: Mapping[str, ExtKind],
+    pdf_cache: PdfMetaCache,
+) -> FileProbe:
+    """
+    stat/resolve a path and read its page count (PDF, image, eml).
+
+    Doc/docx pages are left to the Word worker. pdf_cache is only read
+    here; the GUI thread stores new results in it.
+    """
+    probe = FileProbe(path)
+    try:
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            return probe
+        resolved = path.resolve()
+    except (OSError, ValueError):
+        return probe
+
+    probe.resolved = resolved
+    suffix = os.path.splitext(path.name)[1].lower()
+    probe.ext = suffix[1:]
+    probe.kind = kind = ext_kind.get(suffix)
+    probe.size_bytes = st.st_size
+    probe.stamp = (st.st_mtime_ns, st.st_size)
+
+    if kind == "pdf":
+        cached = pdf_cache.get(resolved)
+        try:
+            if cached is not None and cached[0] == probe.stamp:
+                probe.encrypted, probe.pages = cached[1]
+            else:
+                probe.encrypted, probe.pages = read_pdf_meta(resolved)
+        except Exception as exc:
+            probe.error = str(exc)
+    elif kind == "image":
+        probe.pages = 1
+    elif kind == "eml":
+        try:
+            from snapmerge.services.eml_to_pdf import estimate_eml_pages
+            probe.pages = estimate_eml_pages(resolved)
+        except Exception:
+            probe.pages = None
+    return probe
+
+class FileProbeSignals(QObject):
+    """Signals shared by all FileProbeTask runnables (QRunnable has none)."""
+
+    probed = Signal(int, int, list)     # epoch, chunk sequence, [FileProbe, ...]
+
+class FileProbeTask(QRunnable):
+    """Probe one chunk of paths on a QThreadPool thread."""
+
+    def __init__(
+        self,
+        signals: FileProbeSignals,
+        epoch: int,
+        seq: int,
+        paths: List[Path],
+        ext_kind: Mapping[str, ExtKind],
+        pdf_cache: PdfMetaCache,
+    ) -> None:
+        super().__init__()
+        # The window keeps the task until its result arrives; letting the
+        # pool delete a Python-owned runnable crashes PySide at exit.
+        self.setAutoDelete(False)
+        self._signals = signals
+        self._epoch = epoch
+        self._seq = seq
+        self._paths = paths
+        self._ext_kind = ext_kind
+        self._pdf_cache = pdf_cache
+
+    def _probe(self, path: Path) -> FileProbe:
+        try:
+            return probe_file(path, self._ext_kind, self._pdf_cache)
+        except Exception as exc:
+            # The GUI applies chunks strictly in order and blocks Merge until
+            # every chunk arrives, so this chunk's signal must always fire.
+            return FileProbe(path, error=str(exc))
+
+    def run(self) -> None:
+        probes = [self._probe(p) for p in self._paths]
+        self._signals.probed.emit(self._epoch, self._seq, probes)
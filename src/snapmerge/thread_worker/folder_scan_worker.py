@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List, Optional
+from PySide6.QtCore import QObject, Signal, Slot
+
+from snapmerge.services.file_discovery import scan_folder
+
+# Paths are handed to the GUI thread in chunks of this size
+SCAN_BATCH_SIZE = 500
+
+class FolderScanWorker(QObject):
+    """Worker that lists the supported files of a folder in a QThread."""
+
+    batch = Signal(list)                # [Path, ...] found since the last batch
+    finished = Signal(int)              # total files found
+    error = Signal(str, str)            # message, traceback
+
+    def __init__(
+        self,
+        folder: Path,
+        allowed_exts: Iterable[str],
+        recursive: bool,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._folder = folder
+        self._allowed_exts = frozenset(allowed_exts)
+        self._recursive = recursive
+
+    @Slot()
+    def run(self) -> None:
+        """It runs within the QThread."""
+        import traceback
+
+        pending: List[Path] = []
+        total = 0
+        try:
+            for path in scan_folder(self._folder, self._allowed_exts, self._recursive):
+                pending.append(path)
+                if len(pending) >= SCAN_BATCH_SIZE:
+                    total += len(pending)
+                    self.batch.emit(pending)
+                    pending = []
+        except Exception as exc:
+            self.error.emit(str(exc), traceback.format_exc())
+            return
+
+        if pending:
+            total += len(pending)
+            self.batch.emit(pending)
+        self.finished.emit(total)
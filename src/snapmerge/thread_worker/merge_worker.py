@@ -7,14 +7,18 @@ responsive.  It does **not** know anything about widgets; it only talks
 in terms of paths, settings and Qt signals.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from time import monotonic
 from typing import Optional, Dict, Any
 
 from PySide6.QtCore import QObject, Signal, Slot
 
 from ..config import Settings
-from ..pipeline import run_merge
+
+# Progress signals cross the thread boundary; emit at most this often
+# (seconds) unless enough items completed since the last one.
+PROGRESS_EMIT_INTERVAL = 0.05
 
 class MergeCancelledError(Exception):
     """Raised when the user requests cancellation of the merge job."""
@@ -24,22 +28,27 @@ class MergeCancelledError(Exception):
 class MergeJob:
     """Small data container with everything the worker needs.
 
-    - ``input_dir``  : Folder that already contains the *ordered* files
-                       to be merged (usually a staging/temp directory
-                       prepared by the UI).
     - ``output_pdf`` : Final PDF path selected by the user.
     - ``settings``   : Settings instance (usually loaded from config.yaml).
+    - ``files``      : Files to merge, in order (the UI passes its table
+                       order). When given, ``input_dir`` is not scanned.
+    - ``input_dir``  : Folder to discover files in (``run_merge``), used
+                       when ``files`` is empty.
     - ``log_file``   : Optional path where the pipeline will write a log.
+    - ``cache_dir``  : Optional folder where converted PDFs are kept and
+                       reused by later merges (see ConversionCache).
     """
 
-    input_dir: Path
     output_pdf: Path
     settings: Settings
+    files: list[Path] = field(default_factory=list)
+    input_dir: Optional[Path] = None
     log_file: Optional[Path] = None
+    cache_dir: Optional[Path] = None
 
 
 class MergeWorker(QObject):
-    """QObject that runs ``run_merge`` in a background thread.
+    """QObject that runs the merge pipeline in a background thread.
 
     You create it in the main window, move it to a ``QThread`` and
     connect its signals to update the progress bar, log widget, etc.
@@ -70,11 +79,32 @@ class MergeWorker(QObject):
         super().__init__(parent)
         self._job = job
         self._cancel_requested = False
+        # channel -> (monotonic time, done) of the last emitted progress
+        self._last_emit: Dict[str, tuple[float, int]] = {}
 
     # --------------------------- internal callbacks -----------------------
+    def _emit_due(self, channel: str, done: int, total: int) -> bool:
+        """Return True when a progress signal for ``channel`` should go out.
+
+        Always emits the final step; otherwise only once per
+        ``PROGRESS_EMIT_INTERVAL`` or every ~0.5% of ``total`` items.
+        """
+        last_ts, last_done = self._last_emit.get(channel, (0.0, 0))
+        now = monotonic()
+        if (
+            done >= total
+            or done < last_done
+            or now - last_ts >= PROGRESS_EMIT_INTERVAL
+            or done - last_done >= max(1, total // 200)
+        ):
+            self._last_emit[channel] = (now, done)
+            return True
+        return False
+
     def _progress_cb(self, done: int, total: int) -> None:
         self._check_cancel()
-        self.progress.emit(done, total)
+        if self._emit_due("progress", done, total):
+            self.progress.emit(done, total)
 
     def _status_cb(self, message: str) -> None:
         self._check_cancel()
@@ -86,7 +116,8 @@ class MergeWorker(QObject):
 
     def _merge_progress_cb(self, done: int, total: int) -> None:
         self._check_cancel()
-        self.merge_progress.emit(done, total)
+        if self._emit_due("merge_progress", done, total):
+            self.merge_progress.emit(done, total)
         
     # --------------------------- cancellation API -------------------------
     def request_cancel(self):
@@ -112,18 +143,33 @@ class MergeWorker(QObject):
         so the GUI thread can decide how to show it (message box, log, etc.).
         """
         import traceback
-
+        # Deferred so the GUI can start without loading the conversion stack
+        # (Pillow, PyPDF2, reportlab) until the first merge.
+        from ..pipeline import run_manual_merge, run_merge
+
+        callbacks = dict(
+            progress_cb=self._progress_cb,
+            status_cb=self._status_cb,
+            merge_start_cb=self._merge_start_cb,
+            merge_progress_cb=self._merge_progress_cb,
+            log_file=self._job.log_file,
+            cache_dir=self._job.cache_dir,
+        )
         try:
-            report: Dict[str, Any] = run_merge(
-                input_dir=self._job.input_dir,
-                output_pdf=self._job.output_pdf,
-                settings=self._job.settings,
-                progress_cb=self._progress_cb,
-                status_cb=self._status_cb,
-                merge_start_cb=self._merge_start_cb,
-                merge_progress_cb=self._merge_progress_cb,
-                log_file=self._job.log_file,
-            )
+            if self._job.files:
+                report: Dict[str, Any] = run_manual_merge(
+                    files=self._job.files,
+                    output_pdf=self._job.output_pdf,
+                    settings=self._job.settings,
+                    **callbacks,
+                )
+            else:
+                report = run_merge(
+                    input_dir=self._job.input_dir,
+                    output_pdf=self._job.output_pdf,
+                    settings=self._job.settings,
+                    **callbacks,
+                )
         except MergeCancelledError:
             # "Normal" cancellation is not a user or system error
             self.status.emit("Merge cancelled by user.")
@@ -4,6 +4,9 @@ from typing import Literal
 
 SortBy = Literal["name", "created", "modified"]
 
+# What a file is, by its (lowercase, dotted) suffix; see Settings.ext_kinds
+ExtKind = Literal["pdf", "image", "doc", "eml", "zip"]
+
 @dataclass
 class JobSettings:
     input_dir: Path
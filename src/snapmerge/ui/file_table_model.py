@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QByteArray,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    Qt,
+)
+
+# Columns: #, Name, Type, Size, Pages, Path
+COLUMNS = ("#", "Name", "Type", "Size", "Pages", "Path")
+COL_INDEX, COL_NAME, COL_TYPE, COL_SIZE, COL_PAGES, COL_PATH = range(len(COLUMNS))
+
+# Units for format_size, one per power of 1024
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# MIME type used to carry row numbers during an internal drag
+ROWS_MIME_TYPE = "application/x-snapmerge-rows"
+
+_ALIGNMENT = {
+    COL_INDEX: Qt.AlignCenter,
+    COL_SIZE: Qt.AlignRight | Qt.AlignVCenter,
+    COL_PAGES: Qt.AlignCenter,
+}
+
+def format_size(num_bytes: int) -> str:
+    """Human readable size ("12 KB"), rounded like "{:.0f}"."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    # The unit follows from the bit length (10 bits per step); the value
+    # is rounded half-to-even with integer math, like the old "{:.0f}".
+    idx = min((num_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    divisor = 1 << (idx * 10)
+    value, rem = divmod(num_bytes, divisor)
+    if 2 * rem > divisor or (2 * rem == divisor and value & 1):
+        value += 1
+    return f"{value} {SIZE_UNITS[idx]}"
+
+@dataclass(slots=True)
+class FileRow:
+    """One entry of the file list (path is already resolved)."""
+
+    path: Path
+    name: str
+    ext: str  # lowercase, without the dot
+    size_bytes: int
+    pages: Optional[int] = None
+
+class FileTableModel(QAbstractTableModel):
+    """
+    Table model over a plain list of FileRow.
+
+    Display strings are built in data() only for the cells Qt paints, and
+    the # column is the row position, so nothing has to be renumbered after
+    a move, sort or removal.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.rows: List[FileRow] = []
+
+    # -------------------- Read-only model API -------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display(index.row(), col)
+
+        if role == Qt.TextAlignmentRole:
+            return _ALIGNMENT.get(col)
+
+        if role == Qt.UserRole:
+            # The raw row, for callers that need more than the display text
+            return self.rows[index.row()]
+
+        return None
+
+    def _display(self, r: int, col: int) -> str | None:
+        row = self.rows[r]
+        if col == COL_INDEX:
+            return str(r + 1)
+        if col == COL_NAME:
+            return row.name
+        if col == COL_TYPE:
+            return row.ext
+        if col == COL_SIZE:
+            return format_size(row.size_bytes)
+        if col == COL_PAGES:
+            return "" if row.pages is None else str(row.pages)
+        if col == COL_PATH:
+            return str(row.path)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(COLUMNS):
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            # Dropping between/below rows
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    # -------------------- Editing -------------------------------------
+    def append_rows(self, new_rows: Iterable[FileRow]) -> None:
+        """Append rows with a single rowsInserted notification."""
+        new_rows = list(new_rows)
+        if not new_rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self.rows.extend(new_rows)
+        self.endInsertRows()
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self.rows):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.rows.clear()
+        self.endResetModel()
+
+    def moveRows(
+        self,
+        source_parent: QModelIndex,
+        source_row: int,
+        count: int,
+        destination_parent: QModelIndex,
+        destination_child: int,
+    ) -> bool:
+        """Move count rows so they end up before destination_child (Qt semantics)."""
+        if source_parent.isValid() or destination_parent.isValid():
+            return False
+        if count <= 0 or source_row < 0 or source_row + count > len(self.rows):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            # Moving onto itself is a no-op (and rejected by beginMoveRows)
+            return False
+        if not self.beginMoveRows(
+            QModelIndex(), source_row, source_row + count - 1, QModelIndex(), destination_child
+        ):
+            return False
+        moved = self.rows[source_row:source_row + count]
+        del self.rows[source_row:source_row + count]
+        if destination_child > source_row:
+            destination_child -= count
+        self.rows[destination_child:destination_child] = moved
+        self.endMoveRows()
+        return True
+
+    def shift_rows(self, rows: Iterable[int], delta: int) -> bool:
+        """
+        Move each of rows one step up (delta=-1) or down (+1) in one layout change.
+
+        Rows that would leave the table stay put, and so does a row blocked
+        by such a row. Returns False when nothing moved.
+        """
+        n = len(self.rows)
+        order = list(range(n))
+        stuck: set[int] = set()
+        for r in sorted(set(rows), reverse=delta > 0):
+            t = r + delta
+            if not 0 <= r < n:
+                continue
+            if not 0 <= t < n or t in stuck:
+                stuck.add(r)
+                continue
+            order[t], order[r] = order[r], order[t]
+        if order == list(range(n)):
+            return False
+        self._reorder(order)
+        return True
+
+    def update_pages(self, pages_by_path: dict[Path, int]) -> int:
+        """
+        Set the Pages value of every row whose path is in pages_by_path.
+
+        Returns how much the sum of all pages changed.
+        """
+        changed = [
+            i for i, row in enumerate(self.rows)
+            if row.path in pages_by_path and row.pages != pages_by_path[row.path]
+        ]
+        delta = 0
+        for i in changed:
+            row = self.rows[i]
+            new_pages = pages_by_path[row.path]
+            delta += (new_pages or 0) - (row.pages or 0)
+            row.pages = new_pages
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], COL_PAGES),
+                self.index(changed[-1], COL_PAGES),
+                [Qt.DisplayRole],
+            )
+        return delta
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """
+        Stable (Timsort) sort by a column, keyed on the FileRow fields.
+
+        Name ignores case; Type sorts by extension, then name. Size and
+        Pages sort on the raw numbers (so "100 KB" < "20 MB"; rows without
+        pages first).
+        """
+        if column == COL_INDEX or not 0 <= column < len(COLUMNS):
+            return
+        rows = self.rows
+        if column == COL_NAME:
+            key = lambda i: rows[i].name.casefold()
+        elif column == COL_TYPE:
+            key = lambda i: (rows[i].ext, rows[i].name.casefold())
+        elif column == COL_SIZE:
+            key = lambda i: rows[i].size_bytes
+        elif column == COL_PAGES:
+            key = lambda i: -1 if rows[i].pages is None else rows[i].pages
+        else:
+            key = lambda i: str(rows[i].path)
+        reverse = order == Qt.DescendingOrder
+        new_order = sorted(range(len(rows)), key=key, reverse=reverse)
+        self._reorder(new_order)
+
+    def _reorder(self, new_order: List[int]) -> None:
+        """Rearrange rows so that new row i is old row new_order[i]."""
+        if new_order == list(range(len(self.rows))):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_to_new = {old: new for new, old in enumerate(new_order)}
+        self.rows = [self.rows[i] for i in new_order]
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(old_to_new[i.row()], i.column()) for i in old_indexes],
+        )
+        self.layoutChanged.emit()
+
+    # -------------------- Internal drag & drop ------------------------
+    def supportedDropActions(self) -> Qt.DropActions:
+        return Qt.MoveAction
+
+    def mimeTypes(self) -> List[str]:
+        return [ROWS_MIME_TYPE]
+
+    def mimeData(self, indexes: List[QModelIndex]) -> QMimeData:
+        rows = sorted({i.row() for i in indexes if i.isValid()})
+        mime = QMimeData()
+        mime.setData(ROWS_MIME_TYPE, QByteArray(",".join(map(str, rows)).encode("ascii")))
+        return mime
+
+    def dropMimeData(
+        self,
+        data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: QModelIndex,
+    ) -> bool:
+        """
+        Move the dragged rows in place.
+
+        Returns False on purpose: the view would otherwise treat the drop as
+        a copy + "remove the source rows", but the rows have already moved.
+        """
+        if action != Qt.MoveAction or not data.hasFormat(ROWS_MIME_TYPE):
+            return False
+        raw = bytes(data.data(ROWS_MIME_TYPE)).decode("ascii")
+        moving = [int(r) for r in raw.split(",") if r]
+        if not moving:
+            return False
+
+        # Drop position: before `row`, on `parent` (dropped onto a row) or at the end
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self.rows)
+
+        moving_set = set(moving)
+        rest = [i for i in range(len(self.rows)) if i not in moving_set]
+        insert_at = sum(1 for i in rest if i < row)
+        self._reorder(rest[:insert_at] + moving + rest[insert_at:])
+        return False
@@ -18,8 +18,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QGridLayout,
     QHBoxLayout, QHeaderView, QLabel, QLineEdit,
     QMainWindow, QMenuBar, QProgressBar, QPushButton,
-    QSizePolicy, QSpacerItem, QStatusBar, QTableWidget,
-    QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget)
+    QSizePolicy, QSpacerItem, QStatusBar, QTableView,
+    QTextEdit, QVBoxLayout, QWidget)
 
 class Ui_SnapMergeWindow(object):
     def setupUi(self, SnapMergeWindow):
@@ -99,21 +99,7 @@ class Ui_SnapMergeWindow(object):
 
         self.verticalLayout.addLayout(self.toolbarLayout)
 
-        self.files_table = QTableWidget(self.centralwidget)
-        if (self.files_table.columnCount() < 6):
-            self.files_table.setColumnCount(6)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.files_table.setHorizontalHeaderItem(5, __qtablewidgetitem5)
+        self.files_table = QTableView(self.centralwidget)
         self.files_table.setObjectName(u"files_table")
         self.files_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.files_table.setDragEnabled(True)
@@ -213,18 +199,6 @@ class Ui_SnapMergeWindow(object):
         self.move_down_btn.setText(QCoreApplication.translate("SnapMergeWindow", u"Move down", None))
         self.sort_name_btn.setText(QCoreApplication.translate("SnapMergeWindow", u"Sort by name", None))
         self.sort_type_btn.setText(QCoreApplication.translate("SnapMergeWindow", u"Sort by type", None))
-        ___qtablewidgetitem = self.files_table.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("SnapMergeWindow", u"#", None));
-        ___qtablewidgetitem1 = self.files_table.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("SnapMergeWindow", u"Name", None));
-        ___qtablewidgetitem2 = self.files_table.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("SnapMergeWindow", u"Type", None));
-        ___qtablewidgetitem3 = self.files_table.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("SnapMergeWindow", u"Size", None));
-        ___qtablewidgetitem4 = self.files_table.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("SnapMergeWindow", u"Pages", None));
-        ___qtablewidgetitem5 = self.files_table.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("SnapMergeWindow", u"Path", None));
         self.label_output.setText(QCoreApplication.translate("SnapMergeWindow", u"Destination file:", None))
         self.browse_output_btn.setText(QCoreApplication.translate("SnapMergeWindow", u"Browse\u2026", None))
         self.total_pages_label.setText(QCoreApplication.translate("SnapMergeWindow", u"Total Pages: 0", None))
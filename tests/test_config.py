@@ -0,0 +1,43 @@
+from pathlib import Path
+from src.snapmerge.config import Settings
+
+def test_from_file_reloads_when_yaml_changes(tmp_path: Path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("workers: 2\n", encoding="utf-8")
+    assert Settings.from_file(cfg).get("workers") == 2
+    assert Settings.from_file(cfg).get("workers") == 2
+
+    cfg.write_text("workers: 16\n", encoding="utf-8")
+    assert Settings.from_file(cfg).get("workers") == 16
+
+def test_allowed_exts_are_lowercase():
+    settings = Settings.from_dict({"allowed_pdfs": [".PDF"]})
+    assert ".pdf" in settings.allowed_exts
+    assert ".PDF" not in settings.allowed_exts
+
+def test_unknown_keys_stay_reachable_through_get():
+    settings = Settings.from_dict({"workers": "8", "max_docs_for_word_batch": 5})
+    assert settings.workers == 8
+    assert settings.get("max_docs_for_word_batch") == 5
+    assert settings.get("missing", 30) == 30
+
+def test_overlay_returns_modified_copy():
+    base = Settings.from_dict({"sort_by": "modified"})
+    run = base.overlay(sort_by="name")
+    assert run.sort_by == "name"
+    assert base.sort_by == "modified"
+    assert run.allowed_exts == base.allowed_exts
+
+def test_from_file_writes_json_sidecar(tmp_path: Path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("workers: 3\n", encoding="utf-8")
+    Settings.from_file(cfg)
+    assert (tmp_path / "config.yaml.jsoncache").exists()
+
+def test_ext_kinds_keep_the_first_group_on_overlap():
+    settings = Settings.from_dict({"allowed_images": [".PNG", ".tif"], "allowed_docs": [".tif"]})
+    assert settings.ext_kinds[".png"] == "image"
+    assert settings.ext_kinds[".tif"] == "image"
+    assert settings.ext_kinds[".eml"] == "eml"
+    assert settings.ext_kinds[".zip"] == "zip"
+    assert set(settings.ext_kinds) == settings.allowed_exts
@@ -0,0 +1,44 @@
+import os
+from pathlib import Path
+from src.snapmerge.services.conversion_cache import ConversionCache
+
+def test_key_changes_with_source_and_options(tmp_path: Path):
+    src = tmp_path / "a.png"
+    src.write_bytes(b"x")
+    key = ConversionCache.key(src, "image", 18, 2000)
+    assert key == ConversionCache.key(src, "image", 18, 2000)
+    assert key != ConversionCache.key(src, "image", 0, 2000)
+
+    src.write_bytes(b"xy")
+    assert key != ConversionCache.key(src, "image", 18, 2000)
+    assert ConversionCache.key(tmp_path / "missing.png", "image") is None
+
+def test_prune_drops_least_recently_used(tmp_path: Path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+    for i, name in enumerate(("a", "b", "c")):
+        produced = tmp_path / f"{name}.pdf"
+        produced.write_bytes(b"x" * 10)
+        entry = cache.put(name, produced)
+        assert entry.parent == cache.root and not produced.exists()
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+    assert cache.get("a") is not None  # now the most recently used
+    cache.prune()
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+def test_put_copies_across_drives_and_drops_produced(tmp_path: Path, monkeypatch):
+    cache = ConversionCache(tmp_path / "cache")
+    produced = tmp_path / "a.pdf"
+    produced.write_bytes(b"pdf")
+
+    real_replace = os.replace
+    def replace(src, dst):
+        if Path(src) == produced:
+            raise OSError("cross-device link")
+        real_replace(src, dst)
+    monkeypatch.setattr(os, "replace", replace)
+
+    entry = cache.put("a", produced)
+    assert entry.parent == cache.root and entry.read_bytes() == b"pdf"
+    assert not produced.exists()
@@ -0,0 +1,22 @@
+from pathlib import Path
+from src.snapmerge.services.file_discovery import scan_folder
+
+def test_scan_folder_filters_by_extension(tmp_path: Path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.PDF").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    (tmp_path / "sub" / "b.png").write_bytes(b"")
+
+    flat = {p.name for p in scan_folder(tmp_path, [".pdf", ".png"], recursive=False)}
+    assert flat == {"a.PDF"}
+
+    deep = {p.name for p in scan_folder(tmp_path, [".pdf", ".png"], recursive=True)}
+    assert deep == {"a.PDF", "b.png"}
+
+def test_scan_folder_ignores_names_without_suffix(tmp_path: Path):
+    (tmp_path / "pdf").write_bytes(b"")
+    (tmp_path / ".pdf").write_bytes(b"")
+    (tmp_path / "c.pdf").write_bytes(b"")
+
+    found = {p.name for p in scan_folder(tmp_path, [".pdf"], recursive=False)}
+    assert found == {"c.pdf"}
@@ -0,0 +1,40 @@
+from pathlib import Path
+from src.snapmerge.thread_worker.file_probe_worker import probe_file
+
+EXT_KIND = {".pdf": "pdf", ".png": "image"}
+
+def test_probe_file_skips_missing_and_directories(tmp_path: Path):
+    assert probe_file(tmp_path / "missing.png", EXT_KIND, {}).resolved is None
+    assert probe_file(tmp_path, EXT_KIND, {}).resolved is None
+
+def test_probe_file_reads_image_and_cached_pdf(tmp_path: Path):
+    img = tmp_path / "A.PNG"
+    img.write_bytes(b"x" * 10)
+    probe = probe_file(img, EXT_KIND, {})
+    assert (probe.ext, probe.kind, probe.size_bytes, probe.pages) == ("png", "image", 10, 1)
+
+    # A cache hit with a matching (mtime_ns, size) never opens the file
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"not a pdf")
+    st = pdf.stat()
+    cache = {pdf.resolve(): ((st.st_mtime_ns, st.st_size), (False, 7))}
+    probe = probe_file(pdf, EXT_KIND, cache)
+    assert (probe.pages, probe.error) == (7, None)
+
+    # Without it, the broken PDF is reported instead of raising
+    assert probe_file(pdf, EXT_KIND, {}).error is not None
+
+def test_probe_task_emits_even_when_probe_raises(monkeypatch):
+    import src.snapmerge.thread_worker.file_probe_worker as worker
+
+    def boom(*args):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(worker, "probe_file", boom)
+
+    signals = worker.FileProbeSignals()
+    got = []
+    signals.probed.connect(lambda epoch, seq, probes: got.append((epoch, seq, probes)))
+    worker.FileProbeTask(signals, 1, 2, [Path("a.pdf")], EXT_KIND, {}).run()
+
+    [(epoch, seq, [probe])] = got
+    assert (epoch, seq, probe.resolved, probe.error) == (1, 2, None, "boom")
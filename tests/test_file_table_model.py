@@ -0,0 +1,90 @@
+from pathlib import Path
+from PySide6.QtCore import QModelIndex, Qt
+from src.snapmerge.ui.file_table_model import (
+    COL_INDEX,
+    COL_NAME,
+    COL_PAGES,
+    COL_SIZE,
+    COL_TYPE,
+    FileRow,
+    FileTableModel,
+    format_size,
+)
+
+def _model(*names: str) -> FileTableModel:
+    model = FileTableModel()
+    model.append_rows(
+        FileRow(Path("/tmp") / n, n, n.rpartition(".")[2], 1536, 1) for n in names
+    )
+    return model
+
+def _names(model: FileTableModel) -> list[str]:
+    return [row.name for row in model.rows]
+
+def test_format_size_rounds_like_float_format():
+    assert format_size(0) == "0 B"
+    assert format_size(1023) == "1023 B"
+    assert format_size(1536) == "2 KB"
+    assert format_size(2560) == "2 KB"
+    assert format_size(5 * 1024 ** 4) == "5 TB"
+
+def test_index_column_follows_row_position():
+    model = _model("a.pdf", "b.pdf", "c.pdf")
+    assert model.index(1, COL_SIZE).data() == "2 KB"
+
+    model.moveRow(QModelIndex(), 2, QModelIndex(), 0)
+    assert _names(model) == ["c.pdf", "a.pdf", "b.pdf"]
+    assert [model.index(r, COL_INDEX).data() for r in range(3)] == ["1", "2", "3"]
+
+    model.removeRows(0, 1)
+    assert _names(model) == ["a.pdf", "b.pdf"]
+    assert model.index(0, COL_INDEX).data() == "1"
+
+def test_sort_by_name_ignores_case_and_is_stable():
+    model = _model("b.pdf", "B.png", "a.pdf")
+    model.sort(COL_NAME)
+    assert _names(model) == ["a.pdf", "b.pdf", "B.png"]
+
+def test_sort_by_type_then_name():
+    model = _model("b.png", "c.pdf", "A.png", "a.pdf")
+    model.sort(COL_TYPE)
+    assert _names(model) == ["a.pdf", "c.pdf", "A.png", "b.png"]
+
+def test_shift_rows_moves_selection_as_a_block():
+    model = _model("a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf")
+    assert model.shift_rows([1, 2, 4], 1)
+    assert _names(model) == ["a.pdf", "d.pdf", "b.pdf", "c.pdf", "e.pdf"]
+
+    # Row 0 can't go up, and blocks row 1 behind it
+    assert model.shift_rows([0, 1, 3], -1)
+    assert _names(model) == ["a.pdf", "d.pdf", "c.pdf", "b.pdf", "e.pdf"]
+    assert not model.shift_rows([0], -1)
+
+def test_size_and_pages_sort_numerically():
+    model = FileTableModel()
+    model.append_rows([
+        FileRow(Path("/tmp/a.pdf"), "a.pdf", "pdf", 100 * 1024, 12),
+        FileRow(Path("/tmp/b.pdf"), "b.pdf", "pdf", 20 * 1024 ** 2, 3),
+        FileRow(Path("/tmp/c.docx"), "c.docx", "docx", 900, None),
+    ])
+    model.sort(COL_SIZE)
+    assert _names(model) == ["c.docx", "a.pdf", "b.pdf"]
+    model.sort(COL_PAGES)
+    assert _names(model) == ["c.docx", "b.pdf", "a.pdf"]
+    assert model.index(0, COL_NAME).data(Qt.UserRole) is model.rows[0]
+
+def test_drop_moves_dragged_rows_in_place():
+    model = _model("a.pdf", "b.pdf", "c.pdf", "d.pdf")
+    mime = model.mimeData([model.index(0, 0), model.index(2, 0)])
+
+    # The model moves the rows itself and reports False so the view
+    # does not remove the sources afterwards.
+    assert model.dropMimeData(mime, model.supportedDropActions(), 4, 0, QModelIndex()) is False
+    assert _names(model) == ["b.pdf", "d.pdf", "a.pdf", "c.pdf"]
+
+def test_update_pages_returns_total_delta():
+    model = _model("a.docx", "b.docx")
+    model.rows[1].pages = None
+    delta = model.update_pages({Path("/tmp/a.docx"): 4, Path("/tmp/b.docx"): 2})
+    assert delta == (4 - 1) + 2
+    assert [row.pages for row in model.rows] == [4, 2]
@@ -0,0 +1,22 @@
+import io
+from pathlib import Path
+from PIL import Image
+from PyPDF2 import PdfReader
+from src.snapmerge.services.image_to_pdf import PAGE_HEIGHT_PX, PAGE_WIDTH_PX, image_to_pdf
+
+def test_large_jpeg_fills_usable_width(tmp_path: Path):
+    # Big enough for a reduced-size JPEG decode; the page layout must not change
+    src = tmp_path / "photo.jpg"
+    Image.new("RGB", (6000, 4500), "black").save(src, quality=90)
+    out = tmp_path / "photo.pdf"
+    image_to_pdf(src, out, margin_pts=20, max_dim=4000)
+
+    data = PdfReader(str(out)).pages[0].images[0].data
+    with Image.open(io.BytesIO(data)) as page:
+        page = page.convert("RGB")
+    assert page.size == (PAGE_WIDTH_PX, PAGE_HEIGHT_PX)
+    # The page image is stored as JPEG: threshold away the blur at the edges
+    dark = page.convert("L").point(lambda v: 255 if v < 128 else 0)
+    left, top, right, bottom = dark.getbbox()
+    assert (left, right) == (20, PAGE_WIDTH_PX - 20)
+    assert abs((bottom - top) - (PAGE_WIDTH_PX - 40) * 3 // 4) <= 1
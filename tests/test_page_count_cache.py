@@ -0,0 +1,33 @@
+from pathlib import Path
+from src.snapmerge.services.page_count_cache import PageCountCache
+
+def test_counts_survive_reload_and_miss_on_new_stamp(tmp_path: Path):
+    file = tmp_path / "cache" / "doc_pages.json"
+    doc = tmp_path / "a.docx"
+
+    cache = PageCountCache(file)
+    cache.put(doc, (10, 200), 3)
+    cache.save()
+
+    reloaded = PageCountCache(file)
+    assert reloaded.get(doc, (10, 200)) == 3
+    # Edited since it was counted: different mtime/size
+    assert reloaded.get(doc, (11, 200)) is None
+
+def test_save_drops_least_recently_used(tmp_path: Path):
+    file = tmp_path / "doc_pages.json"
+    cache = PageCountCache(file, max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.put(tmp_path / name, (1, 1), 1)
+    cache.get(tmp_path / "a", (1, 1))
+    cache.save()
+
+    reloaded = PageCountCache(file)
+    assert reloaded.get(tmp_path / "a", (1, 1)) == 1
+    assert reloaded.get(tmp_path / "b", (1, 1)) is None
+    assert reloaded.get(tmp_path / "c", (1, 1)) == 1
+
+def test_broken_file_starts_empty(tmp_path: Path):
+    file = tmp_path / "doc_pages.json"
+    file.write_text("{not json", encoding="utf-8")
+    assert PageCountCache(file).get(tmp_path / "a", (1, 1)) is None
@@ -0,0 +1,23 @@
+from pathlib import Path
+from PyPDF2 import PdfReader, PdfWriter
+from src.snapmerge.services.pdf_merge import merge_pdfs
+
+def _blank_pdf(path: Path, pages: int) -> Path:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=100, height=100)
+    with path.open("wb") as fh:
+        writer.write(fh)
+    return path
+
+def test_merge_skips_unreadable_and_keeps_order(tmp_path: Path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    inputs = [_blank_pdf(tmp_path / "a.pdf", 2), broken, _blank_pdf(tmp_path / "b.pdf", 1)]
+    messages = []
+
+    out = tmp_path / "out" / "merged.pdf"
+    merge_pdfs(inputs, out, status_cb=messages.append)
+
+    assert len(PdfReader(str(out)).pages) == 3
+    assert any(m.startswith("Skipping (unreadable/encrypted): broken.pdf") for m in messages)
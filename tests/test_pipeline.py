@@ -1,6 +1,7 @@
+import io
 from pathlib import Path
 from src.snapmerge.config import Settings
-from src.snapmerge.pipeline import run_merge
+from src.snapmerge.pipeline import run_manual_merge, run_merge
 import pytest
 
 def test_runs_with_empty_folder(tmp_path: Path):
@@ -11,4 +12,134 @@ def test_runs_with_empty_folder(tmp_path: Path):
     try:
         run_merge(tmp_path, out, settings)
     except Exception as exc:
-        assert "No eligible files" in str(exc)
\ No newline at end of file
+        assert "No eligible files" in str(exc)
+
+def _page_colors(pdf: Path) -> list[int]:
+    """Dominant RGB channel (0, 1, 2) at the center of each page's image."""
+    from PIL import Image
+    from PyPDF2 import PdfReader
+
+    channels = []
+    for page in PdfReader(str(pdf)).pages:
+        with Image.open(io.BytesIO(page.images[0].data)) as img:
+            center = img.convert("RGB").getpixel((img.width // 2, img.height // 2))
+        channels.append(max(range(3), key=center.__getitem__))
+    return channels
+
+def test_manual_merge_keeps_order_of_same_named_images(tmp_path: Path):
+    from PIL import Image
+
+    # Same file name in two folders: converted PDFs must not overwrite each other
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    Image.new("RGB", (40, 20), "red").save(tmp_path / "a" / "scan.png")
+    Image.new("RGB", (20, 40), "blue").save(tmp_path / "b" / "scan.png")
+
+    out = tmp_path / "out.pdf"
+    files = [tmp_path / "b" / "scan.png", tmp_path / "a" / "scan.png"]
+    report = run_manual_merge(files, out, Settings())
+
+    assert report["merged_count"] == 2
+    # b/scan.png (blue) first, then a/scan.png (red)
+    assert _page_colors(out) == [2, 0]
+
+def test_parallel_conversion_keeps_input_order(tmp_path: Path, monkeypatch):
+    from PIL import Image
+    import src.snapmerge.pipeline as pipeline
+
+    # Take the process pool path even on a single-CPU runner
+    monkeypatch.setattr(pipeline.os, "cpu_count", lambda: 4)
+
+    colors = ["red", "lime", "blue", "red", "blue", "lime"]
+    files = []
+    for i, color in enumerate(colors):
+        files.append(tmp_path / f"{i}.png")
+        Image.new("RGB", (30, 30), color).save(files[-1])
+
+    out = tmp_path / "out.pdf"
+    # Enough conversions (and workers) for the process pool path
+    report = run_manual_merge(files, out, Settings(workers=4))
+
+    assert report["converted_count"] == len(colors)
+    assert _page_colors(out) == [0, 1, 2, 0, 2, 1]
+
+def test_cache_dir_reuses_converted_files(tmp_path: Path, monkeypatch):
+    from PIL import Image
+    import src.snapmerge.pipeline as pipeline
+
+    img = tmp_path / "scan.png"
+    Image.new("RGB", (30, 30), "blue").save(img)
+    cache_dir = tmp_path / "cache"
+
+    run_manual_merge([img], tmp_path / "first.pdf", Settings(), cache_dir=cache_dir)
+    # Converted next to the cache and moved in; the job's temp dir is gone
+    assert [p.suffix for p in cache_dir.iterdir()] == [".pdf"]
+
+    def fail(*args):
+        raise AssertionError("converted again")
+
+    monkeypatch.setattr(pipeline, "_convert_file", fail)
+    out = tmp_path / "second.pdf"
+    report = run_manual_merge([img], out, Settings(), cache_dir=cache_dir)
+    assert report["converted_count"] == 1
+    assert _page_colors(out) == [2]
+
+    # Other conversion options miss the cache
+    with pytest.raises(RuntimeError):
+        run_manual_merge([img], out, Settings(image_margin_pts=3), cache_dir=cache_dir)
+
+def test_inline_doc_conversions_share_one_word_session(tmp_path: Path, monkeypatch):
+    from PIL import Image
+    import src.snapmerge.pipeline as pipeline
+
+    sessions = []
+    def fake_docx_to_pdf(src, outp, session=None):
+        sessions.append(session)
+        return False  # e.g. Word not installed
+
+    monkeypatch.setattr(pipeline, "docx_to_pdf", fake_docx_to_pdf)
+    files = [tmp_path / "a.docx", tmp_path / "b.docx", tmp_path / "c.png"]
+    files[0].write_bytes(b"x")
+    files[1].write_bytes(b"y")
+    Image.new("RGB", (10, 10), "red").save(files[2])
+
+    report = run_manual_merge(files, tmp_path / "out.pdf", Settings(workers=1))
+
+    assert report["skipped_count"] == 2
+    assert len(sessions) == 2 and sessions[0] is not None and sessions[0] is sessions[1]
+    assert pipeline._word_session is None
+
+def test_per_file_status_lines_are_throttled(tmp_path: Path, monkeypatch):
+    from PyPDF2 import PdfWriter
+    import src.snapmerge.pipeline as pipeline
+
+    files = []
+    for i in range(5):
+        writer = PdfWriter()
+        writer.add_blank_page(width=100, height=100)
+        files.append(tmp_path / f"{i}.pdf")
+        with files[-1].open("wb") as fh:
+            writer.write(fh)
+    files.insert(2, tmp_path / "broken.pdf")
+    files[2].write_bytes(b"not a pdf")
+
+    # The clock never advances: only the first per-file line gets through
+    monkeypatch.setattr(pipeline.time, "monotonic", lambda: 100.0)
+    messages = []
+    run_manual_merge(files, tmp_path / "out.pdf", Settings(), status_cb=messages.append)
+
+    assert sum(m.startswith("Merging: ") for m in messages) == 1
+    assert any(m.startswith("Skipping (unreadable/encrypted): broken.pdf") for m in messages)
+    assert "Finalizing (writing PDF…)" in messages
+
+def test_missing_input_is_skipped_not_fatal(tmp_path: Path):
+    from PIL import Image
+
+    present = tmp_path / "a.png"
+    Image.new("RGB", (10, 10), "red").save(present)
+    gone = tmp_path / "gone.png"  # e.g. deleted after it was added to the list
+
+    report = run_manual_merge([present, gone], tmp_path / "out.pdf", Settings())
+
+    assert report["merged_count"] == 1
+    assert report["skipped"] == [str(gone)]
@@ -0,0 +1,19 @@
+from pathlib import Path
+from src.snapmerge.services.temp_utils import TMPDIR_ENV, pick_temp_root
+
+def test_pick_temp_root_prefers_configured_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(TMPDIR_ENV, str(tmp_path))
+    assert pick_temp_root() == str(tmp_path)
+
+    # A folder that doesn't exist is ignored
+    monkeypatch.setenv(TMPDIR_ENV, str(tmp_path / "missing"))
+    assert pick_temp_root(10 ** 18) is None
+
+
+def test_pick_temp_root_without_ram_uses_system_default(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv(TMPDIR_ENV, raising=False)
+    assert pick_temp_root(prefer_ram=False) is None
+
+    # The configured folder still wins
+    monkeypatch.setenv(TMPDIR_ENV, str(tmp_path))
+    assert pick_temp_root(prefer_ram=False) == str(tmp_path)